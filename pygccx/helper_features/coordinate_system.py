@@ -17,6 +17,9 @@ along with pygccx.
 If not, see <http://www.gnu.org/licenses/>.
 '''
 
+import os
+import weakref
+from math import cos, sin, hypot, atan2, radians
 from dataclasses import dataclass, field, InitVar, replace
 from typing import Sequence, Optional
 
@@ -26,6 +29,11 @@ from pygccx.protocols import number
 import numpy as np
 import numpy.typing as npt
 from scipy.spatial.transform import Rotation
+
+# Shape checks of the single point/vector/tensor transformations can be switched
+# off by setting the environment variable PYGCCX_VALIDATE=0 
+_VALIDATE = os.environ.get('PYGCCX_VALIDATE', '1').strip() not in ('0', 'false', 'False')
+
 @dataclass
 class CoordinateSystem:
     """
@@ -49,14 +57,21 @@ class CoordinateSystem:
 
     _origin:npt.NDArray[np.floating] = field(init=False)
     _matrix:npt.NDArray[np.floating]   = field(init=False)
+    _matrix_T:npt.NDArray[np.floating] = field(init=False, repr=False, compare=False)
+    _is_identity:bool = field(init=False, default=True, repr=False, compare=False)
+    _version:int = field(init=False, default=0, repr=False, compare=False)
+    _cache:dict = field(init=False, default_factory=dict, repr=False, compare=False)
 
     def __post_init__(self, origin, matrix):
         self.set_origin(origin)
         self.set_matrix(matrix)
 
     def get_origin(self) -> npt.NDArray:
-        """Gets the origin of this coordinate system as 1D numpy array"""
-        return self._origin
+        """
+        Gets a copy of the origin of this coordinate system as 1D numpy array.
+        Use set_origin or move to change the origin.
+        """
+        return self._origin.copy()
 
     def set_origin(self, origin:Sequence[number]|npt.NDArray):
         """
@@ -66,19 +81,23 @@ class CoordinateSystem:
             origin (Sequence[number]): New origin. Must be in the form [x,y,z]
 
         Raises:
-            ValueError: Raised if length of origin is not 3
+            ValueError: Raised if shape of origin is not (3,)
         """
-        if len(origin) != 3:
-            raise ValueError(f'origin must have a length of 3, got {len(origin)}')
-        self._origin = np.array(origin, dtype=float)
+        ori = _to_float_array(origin, 'origin')
+        if ori.shape != (3,):
+            raise ValueError(f'origin must have a shape of (3,), got {ori.shape}')
+        self._origin = ori
+        self._changed()
 
     def get_matrix(self) -> npt.NDArray:
         """Gets the orientation matrix of this coordinate system as 2D numpy array.
         row 0: vector of x axis in global system
         row 1: vector of y axis in global system
         row 2: vector of z axis in global system
+
+        The returned array is a copy. Use set_matrix or the rotate methods to change the matrix.
         """
-        return self._matrix
+        return self._matrix.copy()
 
     def set_matrix(self, matrix:Sequence[Sequence[number]]|npt.NDArray):
         """
@@ -92,14 +111,14 @@ class CoordinateSystem:
                                                  row 2: vector of z axis in global system
 
         Raises:
-            ValueError: Raised if number of rows id not 3
-            ValueError: Raised if length of each row is not 3
+            ValueError: Raised if shape of matrix is not (3,3)
         """
-        if len(matrix) != 3:
-            raise ValueError(f'matrix must have a length of 3, got {len(matrix)}')
-        if not all(len(r) == 3 for r in matrix):
-            raise ValueError(f'Each row in matrix must have a length of 3')
-        self._matrix = np.array(matrix, dtype=float)
+        mat = _to_float_array(matrix, 'matrix')
+        if mat.shape != (3,3):
+            raise ValueError(f'matrix must have a shape of (3,3), got {mat.shape}')
+        self._set_matrix(mat)
+        self._is_identity = bool(np.array_equal(self._matrix, np.eye(3)))
+        self._changed()
 
     def move(self, v_inc:Sequence[number]|npt.NDArray):
         """
@@ -109,11 +128,13 @@ class CoordinateSystem:
             v_inc (Sequence[number]|npt.NDArray): Incrementation vector in the form [dx, dy, dz]
 
         Raises:
-            ValueError: Raised if length of v_inc is not 3
+            ValueError: Raised if shape of v_inc is not (3,)
         """
-        if len(v_inc) != 3:
-            raise ValueError(f'v_inc must have a length of 3, got {len(v_inc)}')
-        self._origin += np.array(v_inc, dtype=float)
+        v = _to_float_array(v_inc, 'v_inc')
+        if v.shape != (3,):
+            raise ValueError(f'v_inc must have a shape of (3,), got {v.shape}')
+        self._origin += v
+        self._changed()
         return self
 
     def copy(self) -> 'CoordinateSystem': 
@@ -153,6 +174,59 @@ class CoordinateSystem:
         self._rotate(2, ang, degrees)
         return self
 
+    def rotate_xyz(self, ang_x:number, ang_y:number, ang_z:number, degrees:bool=False):
+        """
+        Rotates this coordinate system about its x-, y- and z-axis by the given angles.
+
+        Same as rotate_x(ang_x).rotate_y(ang_y).rotate_z(ang_z), but the 
+        composed rotation matrix is built in one step.
+
+        Args:
+            ang_x (number): Rotation angle about the x-axis
+            ang_y (number): Rotation angle about the (rotated) y-axis
+            ang_z (number): Rotation angle about the (twice rotated) z-axis
+            degrees (bool): Flag if angles are given in deg. Default = False
+        """
+        if degrees:
+            ang_x, ang_y, ang_z = radians(ang_x), radians(ang_y), radians(ang_z)
+        ca, sa = cos(ang_x), sin(ang_x)
+        cb, sb = cos(ang_y), sin(ang_y)
+        cc, sc = cos(ang_z), sin(ang_z)
+        # transpose of Rx @ Ry @ Rz
+        rot_mat = np.array([[ cb * cc, ca * sc + sa * sb * cc, sa * sc - ca * sb * cc],
+                            [-cb * sc, ca * cc - sa * sb * sc, sa * cc + ca * sb * sc],
+                            [ sb,     -sa * cb,                ca * cb]])
+        self._set_matrix(rot_mat @ self._matrix)
+        self._is_identity = False
+        self._changed()
+        return self
+
+    def rotate_euler(self, seq:str, angles:Sequence[number]|npt.NDArray, degrees:bool=False):
+        """
+        Rotates this coordinate system by a sequence of up to three rotations.
+
+        The notation of seq follows scipy's Rotation.from_euler:
+        Uppercase letters (e.g. 'XYZ') rotate about the own (intrinsic) axes,
+        so rotate_euler('XYZ', [a, b, c]) equals rotate_x(a).rotate_y(b).rotate_z(c).
+        Lowercase letters (e.g. 'xyz') rotate about the fixed global axes.
+
+        Args:
+            seq (str): Axis sequence, e.g. 'XYZ', 'ZXZ' or 'xyz'
+            angles (Sequence[number]|npt.NDArray): Rotation angles, one per axis in seq
+            degrees (bool): Flag if angles are given in deg. Default = False
+
+        Raises:
+            ValueError: Raised if seq or angles are invalid
+        """
+        rot_mat = Rotation.from_euler(seq, angles, degrees=degrees).as_matrix()
+        if seq.isupper():
+            self._set_matrix(rot_mat.T @ self._matrix)
+        else:
+            self._set_matrix(self._matrix @ rot_mat.T)
+        self._is_identity = False
+        self._changed()
+        return self
+
     def transform_point_from_global(self, point:npt.ArrayLike) -> np.ndarray:
         """
         Transforms the given global cartesian point coordinates into this system and
@@ -173,17 +247,9 @@ class CoordinateSystem:
         """
 
         pnt = np.array(point, dtype=float)
-        if pnt.shape != (3,):
+        if _VALIDATE and pnt.shape != (3,):
             raise ValueError(f"Shape of point must be (3,), got {pnt.shape}")
-        
-        pnt -= self._origin
-        pnt = self._matrix @ pnt
-
-        if self.type == EOrientationSystems.CYLINDRICAL: 
-            pnt[0], pnt[1] = (np.hypot(pnt[0], pnt[1]),
-                                    np.arctan2(pnt[1], pnt[0]))
-
-        return pnt
+        return self._point_from_global(pnt)
 
     def transform_point_to_global(self, point:npt.ArrayLike) -> np.ndarray:
         """
@@ -206,16 +272,102 @@ class CoordinateSystem:
         """
 
         pnt = np.array(point, dtype=float)
-        if pnt.shape != (3,):
+        if _VALIDATE and pnt.shape != (3,):
             raise ValueError(f"Shape of point must be (3,), got {pnt.shape}")
-        
+        return self._point_to_global(pnt)
+
+    def transform_points_from_global(self, points:npt.ArrayLike, out:np.ndarray|None=None) -> np.ndarray:
+        """
+        Transforms the given global cartesian point coordinates into this system and
+        returns the new coordinates.
+
+        Batched version of transform_point_from_global.
+
+        Args:
+            points (npt.ArrayLike): 
+                Global cartesian coordinates [[x1,y1,z1], ...]
+                of points to transform. Of shape (N,3)
+            out (np.ndarray|None):
+                Optional. C-contiguous float64 array of shape (N,3) in which the
+                result is stored. May be points itself. 
+                If omitted, a new array is allocated.
+
+        Returns:
+            np.ndarray: Local coordinates [[x',y',z'], ...] or [[r', theta', z'], ...].
+        """
+        pnts = self._check_points(points)
+        out = self._check_out(out, pnts.shape)
+
+        np.subtract(pnts, self._origin, out=out)
+        if not self._is_identity:
+            np.matmul(out, self._matrix_T, out=out)
+
         if self.type == EOrientationSystems.CYLINDRICAL:
-            pnt[0], pnt[1] = (np.cos(pnt[1]) * pnt[0],
-                                    np.sin(pnt[1]) * pnt[0])
-            
-        pnts = self._matrix.T @ pnt
-        pnts += self._origin
+            _cart_to_cyl(out, out=out)
 
+        return out
+
+    def transform_points_to_global(self, points:npt.ArrayLike, out:np.ndarray|None=None) -> np.ndarray:
+        """
+        Transforms the given local point coordinates into the global system and
+        returns the new coordinates.
+
+        Batched version of transform_point_to_global.
+
+        Args:
+            points (npt.ArrayLike): 
+                local cartesian or cylindrical coordinates 
+                [[x',y',z'], ...] or [[r', theta'(rad), z'], ...]
+                of points to transform. Of shape (N,3)
+            out (np.ndarray|None):
+                Optional. C-contiguous float64 array of shape (N,3) in which the
+                result is stored. May be points itself. 
+                If omitted, a new array is allocated.
+
+        Returns:
+            np.ndarray: global cartesian coordinates [[x, y, z], ...].
+        """
+        pnts = self._check_points(points)
+        out = self._check_out(out, pnts.shape)
+        if out is not pnts:
+            np.copyto(out, pnts)
+
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            _cyl_to_cart(out, out=out)
+
+        if not self._is_identity:
+            np.matmul(out, self._matrix, out=out)
+        out += self._origin
+
+        return out
+
+    def transform_points_to_other(self, points:npt.ArrayLike, other:'CoordinateSystem') -> np.ndarray:
+        """
+        Transforms the given point coordinates from this system into an other
+        system and returns the new coordinates.
+
+        Batched version of transform_point_to_other.
+
+        Args:
+            points (npt.ArrayLike): 
+                Local coordinates [[x',y',z'], ...] or [[r', theta', z'], ...] 
+                of points to transform. Of shape (N,3)
+            other (CoordinateSystem): 
+                The system to which the points should be transformed.
+
+        Returns:
+            np.ndarray: Local coordinates [[x'',y'',z''], ...] or [[r'', theta'', z''], ...].
+        """
+        pnts = self._check_points(points)
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            pnts = _cyl_to_cart(pnts)
+
+        m, d = self._get_relative_transform(other)
+        pnts = pnts @ m.T
+        pnts += d
+
+        if other.type == EOrientationSystems.CYLINDRICAL:
+            _cart_to_cyl(pnts, out=pnts)
         return pnts
 
     def transform_point_to_other(self, point:npt.ArrayLike, other:'CoordinateSystem') -> np.ndarray:
@@ -240,9 +392,17 @@ class CoordinateSystem:
         Returns:
             np.ndarray: Local coordinates [x'',y'',z''] or [r'', theta'', z''].
         """
-        return other.transform_point_from_global(
-                   self.transform_point_to_global(point)
-                   )
+        pnt = np.array(point, dtype=float)
+        if _VALIDATE and pnt.shape != (3,):
+            raise ValueError(f"Shape of point must be (3,), got {pnt.shape}")
+
+        if (self.type == EOrientationSystems.RECTANGULAR and
+            other.type == EOrientationSystems.RECTANGULAR):
+            # fused: other.M @ (self.M.T @ p + self.o - other.o)
+            m, d = self._get_relative_transform(other)
+            return m @ pnt + d
+
+        return other._point_from_global(self._point_to_global(pnt))
 
     def transform_vector_from_global(self, vector:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
         """
@@ -268,23 +428,9 @@ class CoordinateSystem:
         """
 
         vec = np.array(vector, dtype=float)
-        if vec.shape != (3,):
+        if _VALIDATE and vec.shape != (3,):
             raise ValueError(f"Shape of vector must be (3,), got {vec.shape}")
-
-        if self.type == EOrientationSystems.CYLINDRICAL: 
-            if ref_point is None:
-                raise ValueError("ref_point must be provided if coordinate system is CYLINDRICAL")
-            ref_pnt = np.array(ref_point, dtype=float)
-            if ref_pnt.shape != (3,):
-                raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
-           
-            phi = self.transform_point_from_global(ref_pnt)[1]
-            c = self.copy()
-            c.rotate_z(phi)
-            return c._matrix @ vec 
-
-        vec = self._matrix @ vec
-        return vec
+        return self._vector_from_global(vec, self._check_ref_point(ref_point))
 
     def transform_vector_to_global(self, vector:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
         """
@@ -307,24 +453,69 @@ class CoordinateSystem:
             np.ndarray: Global vector [vx, vy, vz].
         """
         vec = np.array(vector, dtype=float)
-        if vec.shape != (3,):
+        if _VALIDATE and vec.shape != (3,):
             raise ValueError(f"Shape of vector must be (3,), got {vec.shape}")
         
         if self.type == EOrientationSystems.CYLINDRICAL:
-            if ref_point is None:
-                raise ValueError("ref_point must be provided if coordinate system is CYLINDRICAL")
-            ref_pnt = np.array(ref_point)
-            if ref_pnt.shape != (3,):
-                raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
-            
-            phi = ref_pnt[1]
-            c = self.copy()
-            c.rotate_z(phi)
-            return c._matrix.T @ vec 
+            phi = self._check_ref_point(ref_point)[1] # type: ignore
+            return self._get_cylindrical_matrix(phi).T @ vec 
 
-        vec = self._matrix.T @ vec
+        if not self._is_identity:
+            vec = self._matrix_T @ vec
         return vec
 
+    def transform_vectors_from_global(self, vectors:npt.ArrayLike, ref_points:npt.ArrayLike|None=None) -> np.ndarray:
+        """
+        Transforms the given global vectors into this system and returns them.
+
+        Batched version of transform_vector_from_global.
+
+        Args:
+            vectors (npt.ArrayLike): 
+                Global cartesian vectors [[vx, vy, vz], ...] to transform. Of shape (N,3)
+            ref_points (npt.ArrayLike|None): 
+                Reference points in global system, at which the vectors are acting.
+                Of shape (N,3), or (3,) if all vectors act at the same point.
+                Only required if this system is CYLINCRICAL.
+
+        Returns:
+            np.ndarray: Local vectors [[vx', vy', vz'], ...].
+        """
+        vecs = self._check_points(vectors, 'vectors')
+
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            ref_pnts = self._check_ref_points(ref_points, len(vecs))
+            phi = self.transform_points_from_global(ref_pnts)[:,1]
+            return np.einsum('nij,nj->ni', self._get_cylindrical_matrices(phi), vecs)
+
+        return vecs @ self._matrix_T
+
+    def transform_vectors_to_global(self, vectors:npt.ArrayLike, ref_points:npt.ArrayLike|None=None) -> np.ndarray:
+        """
+        Transforms the given local vectors from this system into the global and returns them.
+
+        Batched version of transform_vector_to_global.
+
+        Args:
+            vectors (npt.ArrayLike): 
+                Local vectors [[vx', vy', vz'], ...] to transform. Of shape (N,3)
+            ref_points (npt.ArrayLike|None): 
+                Reference points in this system at which the vectors are acting.
+                Of shape (N,3), or (3,) if all vectors act at the same point.
+                Only required if this system is CYLINCRICAL.
+
+        Returns:
+            np.ndarray: Global vectors [[vx, vy, vz], ...].
+        """
+        vecs = self._check_points(vectors, 'vectors')
+
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            ref_pnts = self._check_ref_points(ref_points, len(vecs))
+            r = self._get_cylindrical_matrices(ref_pnts[:,1])
+            return np.einsum('nji,nj->ni', r, vecs)
+
+        return vecs @ self._matrix
+
     def transform_vector_to_other(self, other:'CoordinateSystem', vector:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
         """
         Transforms the given local vector into an other system and returns it.
@@ -347,13 +538,12 @@ class CoordinateSystem:
             if ref_point is None:
                 raise ValueError("ref_point must be provided if this or other system is CYLINDRICAL")
             
-            return other.transform_vector_from_global(
-                        self.transform_vector_to_global(vector, ref_point),
-                        self.transform_point_to_global(ref_point)
+            return other._vector_from_global(
+                        *self._to_global_pair(vector, ref_point)
                     )
         # self and other are rectangular
-        return other.transform_vector_from_global(
-                    self.transform_vector_to_global(vector)
+        return other._vector_from_global(
+                    self.transform_vector_to_global(vector), None
                 )
 
     def transform_tensor_from_global(self, tensor:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
@@ -383,23 +573,8 @@ class CoordinateSystem:
         Returns:
             np.ndarray: Local transformed tensor, same shape as given tensor.
         """
-        t, out_shape = self._2matrix(tensor)
-        
-        if self.type == EOrientationSystems.CYLINDRICAL:
-            if ref_point is None:
-                raise ValueError("ref_point must be provided if coordinate system is CYLINDRICAL")
-            ref_pnt = np.array(ref_point, dtype=float)
-            if ref_pnt.shape != (3,):
-                raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
-           
-            phi = self.transform_point_from_global(ref_pnt)[1]
-            c = self.copy()
-            c.rotate_z(phi)
-            t = c._matrix @ t @ c._matrix.T
-            return self._2outshape(t, out_shape)
-
-        t = self._matrix @ t @ self._matrix.T
-        return self._2outshape(t, out_shape)
+        t = self._check_tensor(tensor)
+        return self._tensor_from_global(t, self._check_ref_point(ref_point))
 
     def transform_tensor_to_global(self, tensor:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
         """
@@ -425,23 +600,70 @@ class CoordinateSystem:
         Returns:
             np.ndarray: Global tensor, same shape as given tensor.
         """
-        t, out_shape = self._2matrix(tensor)
+        t = self._check_tensor(tensor)
 
         if self.type == EOrientationSystems.CYLINDRICAL:
-            if ref_point is None:
-                raise ValueError("ref_point must be provided if coordinate system is CYLINDRICAL")
-            ref_pnt = np.array(ref_point, dtype=float)
-            if ref_pnt.shape != (3,):
-                raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
-            
-            phi = ref_pnt[1]
-            c = self.copy()
-            c.rotate_z(phi)
-            t = c._matrix.T @ t @ c._matrix
-            return self._2outshape(t, out_shape)
+            phi = self._check_ref_point(ref_point)[1] # type: ignore
+            return _rotate_tensors(t, self._get_cylindrical_matrix(phi).T)
         
-        t = self._matrix.T @ t @ self._matrix
-        return self._2outshape(t, out_shape)
+        return self._rotate_tensor(t, inverse=True)
+
+    def transform_tensors_from_global(self, tensors:npt.ArrayLike, ref_points:npt.ArrayLike|None=None) -> np.ndarray:
+        """
+        Transforms the given global tensors into this system and returns them.
+
+        Batched version of transform_tensor_from_global. 
+        The tensors can be either given as N vectors with six components
+        [[txx, tyy, tzz, txy, tyz, tzx], ...] or as N 3x3 matrices.
+
+        Args:
+            tensors (npt.ArrayLike): 
+                Global cartesian tensors to transform. Of shape (N,6) or (N,3,3)
+            ref_points (npt.ArrayLike|None): 
+                Reference points in global system, at which the tensors are acting.
+                Of shape (N,3), or (3,) if all tensors act at the same point.
+                Only required if this system is CYLINCRICAL.
+
+        Returns:
+            np.ndarray: Local transformed tensors, same shape as given tensors.
+        """
+        t = self._check_tensors(tensors)
+
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            ref_pnts = self._check_ref_points(ref_points, len(t))
+            loc_pnts = (ref_pnts - self._origin) @ self._matrix_T
+            phi = np.arctan2(loc_pnts[:,1], loc_pnts[:,0])
+            return _rotate_tensors(t, self._get_cylindrical_matrices(phi))
+
+        return _rotate_tensors(t, self._matrix)
+
+    def transform_tensors_to_global(self, tensors:npt.ArrayLike, ref_points:npt.ArrayLike|None=None) -> np.ndarray:
+        """
+        Transforms the given local tensors from this system into the global and returns them.
+
+        Batched version of transform_tensor_to_global. 
+        The tensors can be either given as N vectors with six components
+        [[txx, tyy, tzz, txy, tyz, tzx], ...] or as N 3x3 matrices.
+
+        Args:
+            tensors (npt.ArrayLike): 
+                Local tensors to transform. Of shape (N,6) or (N,3,3)
+            ref_points (npt.ArrayLike|None): 
+                Reference points in this system at which the tensors are acting.
+                Of shape (N,3), or (3,) if all tensors act at the same point.
+                Only required if this system is CYLINCRICAL.
+
+        Returns:
+            np.ndarray: Global tensors, same shape as given tensors.
+        """
+        t = self._check_tensors(tensors)
+
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            ref_pnts = self._check_ref_points(ref_points, len(t))
+            r = self._get_cylindrical_matrices(ref_pnts[:,1])
+            return _rotate_tensors(t, r.transpose(0, 2, 1))
+
+        return _rotate_tensors(t, self._matrix_T)
 
     def transform_tensor_to_other(self, other:'CoordinateSystem', tensor:npt.ArrayLike, ref_point:npt.ArrayLike|None=None) -> np.ndarray:
         """
@@ -468,13 +690,12 @@ class CoordinateSystem:
             if ref_point is None:
                 raise ValueError("ref_point must be provided if this or other system is CYLINDRICAL")
             
-            return other.transform_tensor_from_global(
-                        self.transform_tensor_to_global(tensor, ref_point),
-                        self.transform_point_to_global(ref_point)
+            return other._tensor_from_global(
+                        *self._tensor_to_global_pair(tensor, ref_point)
                     )
         # self and other are rectangular
-        return other.transform_tensor_from_global(
-                    self.transform_tensor_to_global(tensor)
+        return other._tensor_from_global(
+                    self.transform_tensor_to_global(tensor), None
                 )
 
 
@@ -483,29 +704,264 @@ class CoordinateSystem:
         rot_axis = self._matrix[axis]
         rot_ang = np.deg2rad(ang) if degrees else ang
         r = Rotation.from_rotvec(rot_axis * rot_ang)
-        self._matrix = r.apply(self._matrix)
+        self._set_matrix(r.apply(self._matrix))
+        self._is_identity = False
+        self._changed()
+
+    def _point_from_global(self, pnt:np.ndarray) -> np.ndarray:
+        # unchecked version of transform_point_from_global. Modifies pnt.
+        pnt -= self._origin
+        if not self._is_identity:
+            pnt = self._matrix @ pnt
+
+        if self.type == EOrientationSystems.CYLINDRICAL: 
+            x, y = float(pnt[0]), float(pnt[1])
+            pnt[0], pnt[1] = hypot(x, y), atan2(y, x)
+
+        return pnt
+
+    def _point_to_global(self, pnt:np.ndarray) -> np.ndarray:
+        # unchecked version of transform_point_to_global. Modifies pnt.
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            r, phi = float(pnt[0]), float(pnt[1])
+            pnt[0], pnt[1] = r * cos(phi), r * sin(phi)
+            
+        if not self._is_identity:
+            pnt = self._matrix_T @ pnt
+        pnt += self._origin
+
+        return pnt
+
+    def _vector_from_global(self, vec:np.ndarray, ref_pnt:np.ndarray|None) -> np.ndarray:
+        # unchecked version of transform_vector_from_global. 
+        # ref_pnt is only used if this system is CYLINDRICAL. Modifies ref_pnt.
+        if self.type == EOrientationSystems.CYLINDRICAL: 
+            phi = self._point_from_global(ref_pnt)[1] # type: ignore
+            return self._get_cylindrical_matrix(phi) @ vec 
+
+        if not self._is_identity:
+            vec = self._matrix @ vec
+        return vec
 
-    def _2matrix(self, tensor:npt.ArrayLike) -> tuple[np.ndarray, tuple[int,...]]:
+    def _tensor_from_global(self, t:np.ndarray, ref_pnt:np.ndarray|None) -> np.ndarray:
+        # unchecked version of transform_tensor_from_global.
+        # ref_pnt is only used if this system is CYLINDRICAL. Modifies ref_pnt.
+        if self.type == EOrientationSystems.CYLINDRICAL:
+            phi = self._point_from_global(ref_pnt)[1] # type: ignore
+            return _rotate_tensors(t, self._get_cylindrical_matrix(phi))
+
+        return self._rotate_tensor(t)
+
+    def _check_ref_point(self, ref_point:npt.ArrayLike|None) -> np.ndarray|None:
+        # returns ref_point as new float array if this system is CYLINDRICAL, else None
+        if self.type != EOrientationSystems.CYLINDRICAL:
+            return None
+        if ref_point is None:
+            raise ValueError("ref_point must be provided if coordinate system is CYLINDRICAL")
+        ref_pnt = np.array(ref_point, dtype=float)
+        if _VALIDATE and ref_pnt.shape != (3,):
+            raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
+        return ref_pnt
+
+    def _set_matrix(self, mat:np.ndarray):
+        # stores the matrix and its transposed C-contiguous, so that 
+        # the small matrix products take the fast path
+        self._matrix = np.ascontiguousarray(mat)
+        self._matrix_T = np.ascontiguousarray(mat.T)
+
+    def _changed(self):
+        # invalidates all data derived from origin and matrix
+        self._version += 1
+        self._cache.clear()
+
+    def _get_relative_transform(self, other:'CoordinateSystem') -> tuple[np.ndarray, np.ndarray]:
+        # returns (m, d), so that m @ p + d transforms a local cartesian point p 
+        # from this system into local cartesian coordinates of the system other.
+        # Only the transform to the last other system is cached. It is invalidated if 
+        # one of both is changed. other is only weakly referenced, so it can be freed.
+        cached = self._cache.get('relative')
+        if cached is not None and cached[0]() is other and cached[1] == other._version:
+            return cached[2]
+        m = other._matrix @ self._matrix_T
+        d = other._matrix @ (self._origin - other._origin)
+        self._cache['relative'] = (weakref.ref(other), other._version, (m, d))
+        return m, d
+
+    def _get_voigt_transform(self, inverse:bool=False) -> np.ndarray:
+        # returns the cached 6x6 operator for rotating 6-vector tensors
+        # from global into this system (or into global if inverse)
+        key = ('voigt', inverse)
+        t = self._cache.get(key)
+        if t is None:
+            t = _build_voigt_transform(self._matrix_T if inverse else self._matrix)
+            self._cache[key] = t
+        return t
+
+    def _check_tensor(self, tensor:npt.ArrayLike) -> np.ndarray:
 
         t = np.array(tensor, dtype=float)
+        if _VALIDATE and t.shape not in ((6,), (3,3)):
+            raise ValueError(f"Shape of tensor must be (6,) or (3,3), got {t.shape}")
+        return t
+
+    def _check_points(self, points:npt.ArrayLike, name:str='points') -> np.ndarray:
+
+        pnts = np.asarray(points, dtype=float)
+        if pnts.ndim != 2 or pnts.shape[1] != 3:
+            raise ValueError(f"Shape of {name} must be (N,3), got {pnts.shape}")
+        return pnts
+
+    def _check_out(self, out:np.ndarray|None, shape:tuple[int,...]) -> np.ndarray:
+
+        if out is None:
+            return np.empty(shape)
+        if out.shape != shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous float64 array of shape {shape}, "
+                             f"got {out.dtype} array of shape {out.shape}")
+        return out
+
+    def _check_tensors(self, tensors:npt.ArrayLike) -> np.ndarray:
+
+        t = np.array(tensors, dtype=float)
+        if t.ndim not in (2, 3) or t.shape[1:] not in ((6,), (3,3)):
+            raise ValueError(f"Shape of tensors must be (N,6) or (N,3,3), got {t.shape}")
+        return t
+
+    def _check_ref_points(self, ref_points:npt.ArrayLike|None, n:int) -> np.ndarray:
+
+        if ref_points is None:
+            raise ValueError("ref_points must be provided if coordinate system is CYLINDRICAL")
+        ref_pnts = np.array(ref_points, dtype=float)
+        if ref_pnts.shape == (3,):
+            return np.broadcast_to(ref_pnts, (n, 3))
+        if ref_pnts.shape != (n, 3):
+            raise ValueError(f"Shape of ref_points must be ({n}, 3) or (3,), got {ref_pnts.shape}")
+        return ref_pnts
+
+    def _get_cylindrical_matrix(self, phi:float) -> np.ndarray:
+        # returns the matrix of this system rotated about its local z-axis by phi
+        c, s = cos(phi), sin(phi)
+        m0, m1, m2 = self._matrix
+        return np.array([c * m0 + s * m1, c * m1 - s * m0, m2])
+
+    def _get_cylindrical_matrices(self, phi:np.ndarray) -> np.ndarray:
+        # batched version of _get_cylindrical_matrix. Shape (N,3,3)
+        c, s = np.cos(phi)[:,None], np.sin(phi)[:,None]
+        m = self._matrix
+        r = np.empty((len(phi), 3, 3))
+        r[:,0] = c * m[0] + s * m[1]
+        r[:,1] = c * m[1] - s * m[0]
+        r[:,2] = m[2]
+        return r
+
+    def _get_cylindrical_frame(self, ref_point:npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        # returns the matrix rotated to the local cylindrical point ref_point
+        # and ref_point in global coordinates. Both need the same angle,
+        # so it is evaluated only once.
+        ref_pnt = np.array(ref_point, dtype=float)
+        if _VALIDATE and ref_pnt.shape != (3,):
+            raise ValueError(f"Shape of ref_point must be (3,), got {ref_pnt.shape}")
+        r = self._get_cylindrical_matrix(float(ref_pnt[1]))
+        # local cartesian point is ref_pnt[0] * (first row of r) in global orientation
+        glob_pnt = ref_pnt[0] * r[0] + ref_pnt[2] * r[2] + self._origin
+        return r, glob_pnt
+
+    def _to_global_pair(self, vector:npt.ArrayLike, ref_point:npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        # returns (global vector, global ref_point) for a local vector
+        # acting at the local ref_point
+        if self.type != EOrientationSystems.CYLINDRICAL:
+            return (self.transform_vector_to_global(vector),
+                    self.transform_point_to_global(ref_point))
+        vec = np.array(vector, dtype=float)
+        if _VALIDATE and vec.shape != (3,):
+            raise ValueError(f"Shape of vector must be (3,), got {vec.shape}")
+        r, glob_pnt = self._get_cylindrical_frame(ref_point)
+        return r.T @ vec, glob_pnt
+
+    def _tensor_to_global_pair(self, tensor:npt.ArrayLike, ref_point:npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        # returns (global tensor, global ref_point) for a local tensor
+        # acting at the local ref_point
+        if self.type != EOrientationSystems.CYLINDRICAL:
+            return (self.transform_tensor_to_global(tensor),
+                    self.transform_point_to_global(ref_point))
+        t = self._check_tensor(tensor)
+        r, glob_pnt = self._get_cylindrical_frame(ref_point)
+        return _rotate_tensors(t, r.T), glob_pnt
+
+    def _rotate_tensor(self, t:np.ndarray, inverse:bool=False) -> np.ndarray:
+        # returns M @ t @ M.T (M.T @ t @ M if inverse) in the shape of t
         if t.shape == (6,):
-            xx, yy, zz, xy, yz, zx = t
-            return np.array([[xx, xy, zx],
-                             [xy, yy, yz],
-                             [zx, yz, zz]]), t.shape
-        
-        if t.shape == (3,3):
-            return t, t.shape
-        
-        raise ValueError(f"Shape of tensor must be (6,) or (3,3), got {t.shape}")
-
-    def _2outshape(self, matrix:np.ndarray, out_shape:tuple[int,...]) -> np.ndarray:
-        if out_shape == (3,3):
-            return matrix
-        if out_shape == (6,):
-            m = matrix
-            return np.array([m[0,0], m[1,1], m[2,2], m[0,1], m[1,2], m[0,2]])
-        
-        raise ValueError(f"out_shape must be (6,) or (3,3), got {out_shape}")
+            return self._get_voigt_transform(inverse) @ t
+        m = self._matrix_T if inverse else self._matrix
+        return m @ t @ m.T
 
 
+def _cart_to_cyl(xyz:np.ndarray, out:np.ndarray|None=None) -> np.ndarray:
+    """
+    Converts the cartesian points xyz of shape (N,3) into cylindrical ones
+    and writes them to out. out may be xyz itself. 
+    If out is omitted, a new array is allocated.
+    """
+    if out is None:
+        out = np.empty_like(xyz)
+    x, y = xyz[:,0], xyz[:,1]
+    if out is xyz:
+        # x is overwritten by r before theta is computed
+        x = x.copy()
+    else:
+        np.copyto(out[:,2], xyz[:,2])
+    np.hypot(x, y, out=out[:,0])
+    np.arctan2(y, x, out=out[:,1])
+    return out
+
+def _cyl_to_cart(rtz:np.ndarray, out:np.ndarray|None=None) -> np.ndarray:
+    """
+    Converts the cylindrical points rtz of shape (N,3) into cartesian ones
+    and writes them to out. out may be rtz itself. 
+    If out is omitted, a new array is allocated.
+    """
+    if out is None:
+        out = np.empty_like(rtz)
+    r, theta = rtz[:,0], rtz[:,1]
+    if out is rtz:
+        # r is overwritten by x before y is computed
+        r = r.copy()
+    else:
+        np.copyto(out[:,2], rtz[:,2])
+    np.multiply(np.cos(theta), r, out=out[:,0])
+    np.multiply(np.sin(theta), r, out=out[:,1])
+    return out
+
+def _to_float_array(values:npt.ArrayLike, name:str) -> np.ndarray:
+    """Returns values as new float array. Raises ValueError for ragged sequences."""
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        raise ValueError(f'{name} must be a regular sequence of numbers') from None
+
+# index pairs of the components [xx, yy, zz, xy, yz, zx] of a symmetric tensor
+_VOIGT_I = np.array([0, 1, 2, 0, 1, 2])
+_VOIGT_J = np.array([0, 1, 2, 1, 2, 0])
+
+def _build_voigt_transform(r:np.ndarray) -> np.ndarray:
+    """
+    Returns the 6x6 matrix T which rotates a symmetric tensor given as
+    vector [txx, tyy, tzz, txy, tyz, tzx] by the rotation matrix r, so that
+    T @ t equals r @ t @ r.T in vector form.
+    """
+    i, j = _VOIGT_I[:, None], _VOIGT_J[:, None]
+    k, l = _VOIGT_I[None, :], _VOIGT_J[None, :]
+    t = r[..., i, k] * r[..., j, l]
+    # off diagonal components appear twice in the full tensor
+    t[..., :, 3:] += r[..., i, l[:, 3:]] * r[..., j, k[:, 3:]]
+    return t
+
+def _rotate_tensors(t:np.ndarray, r:np.ndarray) -> np.ndarray:
+    """
+    Returns r @ t @ r.T for tensors t of shape (6,), (3,3), (N,6) or (N,3,3). 
+    r is either one rotation matrix of shape (3,3) or one per tensor of shape (N,3,3).
+    """
+    if t.shape[-1] == 6:
+        v = _build_voigt_transform(r)
+        return np.einsum('...ij,...j->...i', v, t)
+    return r @ t @ np.swapaxes(r, -1, -2)
@@ -18,25 +18,104 @@ If not, see <http://www.gnu.org/licenses/>.
 '''
 
 from unittest import TestCase
+from math import radians
+import weakref
 
 from pygccx.helper_features import CoordinateSystem
 from pygccx.enums import EOrientationSystems
 import numpy as np
+from scipy.spatial.transform import Rotation
+
+# matrices after rotate_x, rotate_y, rotate_z about the own axes 
+# by 10, 20, 30 deg (C1) and 30, 40, 50 deg (C2)
+C1_MATRIX = Rotation.from_euler('XYZ', [10, 20, 30], degrees=True).as_matrix().T
+C2_MATRIX = Rotation.from_euler('XYZ', [30, 40, 50], degrees=True).as_matrix().T
+
+# global points used by the point transformation tests
+GLOB_PNTS = np.array([[ 0., 0., 0.],
+                      [ 1., 1., 1.],
+                      [ 1., 2., 3.],
+                      [-6., 4., 7.]])
+
+# Cartesian coordinates of the global points [0,0,0], [1,1,1], [1,2,3], [-6,4,7]
+# calculated with ANSYS Workbench Mechanical
+# in rectangular system C1:
+C1_PNTS_RECT = np.array([[-2.7209705, 9.8683531e-2, 3.685998],
+                         [-1.5682088, 0.77080594,   4.7902588],
+                         [-1.4341189, 2.23157040,   6.477916],
+                         [-6.8625229, 8.44202360,   7.4590895]])
+# in rectangular system C2:
+C2_PNTS_RECT = np.array([[-1.4552322,    1.8868577, -9.6084373],
+                         [-6.7625066e-2, 2.3583302, -8.6852579],
+                         [ 0.85277961,   4.1644548, -7.7414523],
+                         [-0.75323817,  11.884473, -10.353354]])
+
+# Cylindrical coordinates of the global points [0,0,0], [1,1,1], [1,2,3], [-6,4,7]
+# calculated with ANSYS Workbench Mechanical
+# in a cylindrical system coincident with global:
+GLOB_PNTS_CYL = np.array([[0.,        0.,                   0.],
+                          [1.4142136, radians(45.),         1.],
+                          [2.236068,  radians(63.434949),   3.],
+                          [7.2111026, radians(146.30993),   7.]])
+# in cylindrical system C1:
+C1_PNTS_CYL = np.array([[2.7227594, radians(177.92292),   3.685998],
+                        [1.747404,  radians(153.82496),   4.7902588],
+                        [2.6526597, radians(122.72683),   6.477916],
+                        [10.879429, radians(129.10767),   7.4590895]])
+# in cylindrical system C2:
+C2_PNTS_CYL = np.array([[2.3828414, radians(127.64108),   -9.6084373],
+                        [2.3592996, radians(91.642505),   -8.6852579],
+                        [4.2508725, radians(78.427201),   -7.7414523],
+                        [11.908319, radians(93.626557),   -10.353354]])
+
+# global tensor in vector and matrix form
+GLOB_TENS = np.array([0., -1., 0., 0., 0., 0.])
+GLOB_TENS_MAT = np.array([[0.,  0., 0.],
+                          [0., -1., 0.],
+                          [0.,  0., 0.]])
+# GLOB_TENS calculated with ANSYS Workbench Mechanical
+# in rectangular system C1:
+C1_TENS_RECT = np.array([-0.29575993, -0.6776137, -2.6626378e-2, -0.44767285, 0.134322, 8.8741284e-2])
+C1_TENS_RECT_MAT = np.array([[-0.29575993,  -0.44767285,  0.088741284],
+                             [-0.44767285,  -0.6776137,   0.134322],
+                             [ 0.088741284,  0.134322,   -0.026626378]])
+# in cylindrical system C1 at global point [30, 30, 30]:
+C1_TENS_CYL = np.array([-0.81114565, -0.16222797, -2.6626378e-2, -0.36275406, 6.5723232e-2, 0.14696214])
+# global point [30, 30, 30] in cylindrical system C1
+C1_TENS_CYL_REF_PNT = np.array([37.759005, 0.56643013, 36.813822])
+
+# point inputs with invalid shapes
+BAD_POINTS = ([0.], [0., 0.], [0., 0., 0., 0.], [[0., 0., 0.]])
 
 class TestCoordinateSystem(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # translated and rotated systems shared by the tests.
+        # Tests have to work on copies of them.
+        def c1(type):
+            return CoordinateSystem('C1', type=type, origin=[1., 2., -4.], matrix=C1_MATRIX)
+        
+        def c2(type):
+            return CoordinateSystem('C2', type=type, origin=[8., -3., 5.], matrix=C2_MATRIX)
+
+        cls.c1_rect = c1(EOrientationSystems.RECTANGULAR)
+        cls.c1_cyl = c1(EOrientationSystems.CYLINDRICAL)
+        cls.c2_rect = c2(EOrientationSystems.RECTANGULAR)
+        cls.c2_cyl = c2(EOrientationSystems.CYLINDRICAL)
+
     def test_default(self):
         c = CoordinateSystem('C1')
         known_mat = np.array([[1,0,0],[0,1,0],[0,0,1]], dtype=float)
         known_ori = np.zeros(3)
-        self.assertTrue(np.allclose(known_mat, c.get_matrix()))
-        self.assertTrue(np.allclose(known_ori, c.get_origin()))
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
+        np.testing.assert_allclose(known_ori, c.get_origin(), atol=1e-8)
 
     def test_origin_param(self):
         # tests also set_origin(), because its called in __post_init__
         known_ori = np.array([2, 4, 6])
         c = CoordinateSystem('C1', origin=known_ori)
-        self.assertTrue(np.allclose(known_ori, c.get_origin()))
+        np.testing.assert_allclose(known_ori, c.get_origin(), atol=1e-8)
 
     def test_origin_param_wrong_length(self):
         self.assertRaises(ValueError, CoordinateSystem, 'C1', origin=[2, 4, 6, 8])
@@ -51,14 +130,14 @@ class TestCoordinateSystem(TestCase):
         # tests also set_matrix(), because its called in __post_init__
         known_mat = np.array([[0,1,0],[-1,0,0],[0,0,1]], dtype=float)
         c = CoordinateSystem('C1', matrix=known_mat)
-        self.assertTrue(np.allclose(known_mat, c.get_matrix()))
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
 
     def test_move(self):
         c = CoordinateSystem('C1')
         c.move([1,2,3])
-        self.assertTrue(np.allclose([1,2,3], c.get_origin()))
+        np.testing.assert_allclose([1,2,3], c.get_origin(), atol=1e-8)
         c.move([1,2,3])
-        self.assertTrue(np.allclose([2,4,6], c.get_origin()))
+        np.testing.assert_allclose([2,4,6], c.get_origin(), atol=1e-8)
 
     def test_rotate(self):
         c = CoordinateSystem('C1')
@@ -66,27 +145,66 @@ class TestCoordinateSystem(TestCase):
         known_mat = np.array([[1, 0, 0],
                               [0, 0, 1],
                               [0, -1, 0]])
-        self.assertTrue(np.allclose(known_mat, c.get_matrix()))
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
 
         c.rotate_y(90, degrees=True)
         known_mat = np.array([[0, 1, 0],
                               [0, 0, 1],
                               [1, 0, 0]])
-        self.assertTrue(np.allclose(known_mat, c.get_matrix()))
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
 
         c.rotate_z(90, degrees=True)
         known_mat = np.array([[0, 0, 1],
                               [0, -1, 0],
                               [1, 0, 0]])
-        self.assertTrue(np.allclose(known_mat, c.get_matrix()))
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
 
-    def test_transform_point_from_global_exception(self):
+    def test_rotate_sequence(self):
+        # the matrices used by the shared systems of this test case
         c = CoordinateSystem('C1')
+        c.rotate_x(10, degrees=True)
+        c.rotate_y(20, degrees=True)
+        c.rotate_z(30, degrees=True)
+        np.testing.assert_allclose(C1_MATRIX, c.get_matrix(), atol=1e-8)
+
+        c = CoordinateSystem('C2')
+        c.rotate_x(30, degrees=True)
+        c.rotate_y(40, degrees=True)
+        c.rotate_z(50, degrees=True)
+        np.testing.assert_allclose(C2_MATRIX, c.get_matrix(), atol=1e-8)
+
+    def test_rotate_xyz(self):
+        c = CoordinateSystem('C1').rotate_xyz(10, 20, 30, degrees=True)
+        np.testing.assert_allclose(C1_MATRIX, c.get_matrix(), atol=1e-12)
+
+        # composes with an existing rotation like rotate_x, rotate_y, rotate_z
+        c = CoordinateSystem('C2', matrix=C1_MATRIX).rotate_xyz(0.5, -1., 2.)
+        known_mat = CoordinateSystem('C2', matrix=C1_MATRIX).rotate_x(0.5).rotate_y(-1.).rotate_z(2.).get_matrix()
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-12)
+
+    def test_rotate_euler(self):
+        # intrinsic, same as rotate_x, rotate_y, rotate_z
+        c = CoordinateSystem('C1').rotate_euler('XYZ', [10, 20, 30], degrees=True)
+        np.testing.assert_allclose(C1_MATRIX, c.get_matrix(), atol=1e-8)
+        c = CoordinateSystem('C2').rotate_euler('XYZ', [30, 40, 50], degrees=True)
+        np.testing.assert_allclose(C2_MATRIX, c.get_matrix(), atol=1e-8)
+
+        # extrinsic, about global z of an already rotated system
+        c = CoordinateSystem('C1').rotate_x(90, degrees=True)
+        c.rotate_euler('z', [90], degrees=True)
+        known_mat = np.array([[0, 1, 0],
+                              [0, 0, 1],
+                              [1, 0, 0]])
+        np.testing.assert_allclose(known_mat, c.get_matrix(), atol=1e-8)
+
+        self.assertRaises(ValueError, c.rotate_euler, 'XyZ', [1, 2, 3])
+        self.assertRaises(ValueError, c.rotate_euler, 'XYZ', [1, 2])
 
-        self.assertRaises(ValueError, c.transform_point_from_global, [0.])
-        self.assertRaises(ValueError, c.transform_point_from_global, [0., 0.])
-        self.assertRaises(ValueError, c.transform_point_from_global, [0., 0., 0., 0.])
-        self.assertRaises(ValueError, c.transform_point_from_global, [[0., 0., 0.]])
+    def test_transform_point_from_global_exception(self):
+        c = self.c1_rect
+        for bad in BAD_POINTS:
+            with self.subTest(bad=bad):
+                self.assertRaises(ValueError, c.transform_point_from_global, bad)
 
     def test_transform_point_from_global_into_rectangular(self):
 
@@ -98,28 +216,20 @@ class TestCoordinateSystem(TestCase):
         # test one point
         glob_pnt = np.array([-6,4,7], dtype=float)
         loc_pnt = c.transform_point_from_global(glob_pnt)
-        self.assertTrue(np.allclose(glob_pnt, loc_pnt))
+        np.testing.assert_allclose(glob_pnt, loc_pnt, atol=1e-8)
 
         # Test translated and rotated Cosy
         # ------------------------------------------------------------------
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
-        glob_pnts = [[0,0,0],
-                     [1,1,1],
-                     [1,2,3],
-                     [-6,4,7]]
-        loc_pnts = [c.transform_point_from_global(glob_pnt) for glob_pnt in glob_pnts]
-        loc_pnts_ref = [[-2.7209705, 9.8683531e-002, 3.685998],
-                        [-1.5682088, 0.77080594, 4.7902588],
-                        [-1.4341189, 2.2315704, 6.477916],
-                        [-6.8625229, 8.4420236, 7.4590895]] 
-                    # calculated with ANSYS Workbench Mechanical
+        c = self.c1_rect.copy()
+        glob_pnts = GLOB_PNTS
+        loc_pnts = c.transform_points_from_global(glob_pnts)
+        loc_pnts_ref = C1_PNTS_RECT
         
-        for p1, p2 in zip(loc_pnts, loc_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 7)
+        np.testing.assert_allclose(loc_pnts, loc_pnts_ref, atol=1e-7)
+
+        # test one point
+        loc_pnt = c.transform_point_from_global(glob_pnts[-1])
+        np.testing.assert_allclose(loc_pnt, loc_pnts_ref[-1], atol=1e-7)
 
     def test_transform_point_from_global_into_cylindrical(self):
 
@@ -128,54 +238,32 @@ class TestCoordinateSystem(TestCase):
         # test one point
         glob_pnt = np.array([-6,4,7], dtype=float)
         loc_pnt = c.transform_point_from_global(glob_pnt)
-        loc_pnt_ref = np.array([7.2111026, np.deg2rad(146.30993), 7.])
-                      # calculated with ANSYS Workbench Mechanical
+        loc_pnt_ref = GLOB_PNTS_CYL[-1]
 
-        for c1, c2 in zip(loc_pnt, loc_pnt_ref):
-            self.assertAlmostEqual(c1, c2, 7) #type: ignore
+        np.testing.assert_allclose(loc_pnt, loc_pnt_ref, atol=1e-7)
 
         # test multiple points
-        glob_pnts = [[0,0,0],
-                    [1,1,1],
-                    [1,2,3],
-                    [-6,4,7]]
+        glob_pnts = GLOB_PNTS
         
-        loc_pnts = [c.transform_point_from_global(glob_pnt) for glob_pnt in glob_pnts]
+        loc_pnts = c.transform_points_from_global(glob_pnts)
 
-        loc_pnts_ref =[[0.,	0.,	0.],
-                        [1.4142136,	np.deg2rad(45.),	1.],
-                        [2.236068,	np.deg2rad(63.434949),	3.],
-                        [7.2111026,	np.deg2rad(146.30993),	7.]]
-                    # calculated with ANSYS Workbench Mechanical
-        for p1, p2 in zip(loc_pnts, loc_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
+        loc_pnts_ref = GLOB_PNTS_CYL
+        np.testing.assert_allclose(loc_pnts, loc_pnts_ref, atol=1e-6)
 
         # Test translated and rotated Cosy
         # ------------------------------------------------------------------
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
-        loc_pnts = [c.transform_point_from_global(glob_pnt) for glob_pnt in glob_pnts]
+        c = self.c1_cyl.copy()
+        loc_pnts = c.transform_points_from_global(glob_pnts)
         
-        loc_pnts_ref =[[2.7227594,	np.deg2rad(177.92292),	3.685998],
-                        [1.747404,	np.deg2rad(153.82496),	4.7902588],
-                        [2.6526597,	np.deg2rad(122.72683),	6.477916],
-                        [10.879429,	np.deg2rad(129.10767),	7.4590895]]
-                       # calculated with ANSYS Workbench Mechanical
+        loc_pnts_ref = C1_PNTS_CYL
 
-        for p1, p2 in zip(loc_pnts, loc_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_pnts, loc_pnts_ref, atol=1e-6)
 
     def test_transform_point_to_global_exception(self):
-        c = CoordinateSystem('C1')
-
-        self.assertRaises(ValueError, c.transform_point_to_global, [0.])
-        self.assertRaises(ValueError, c.transform_point_to_global, [0., 0.])
-        self.assertRaises(ValueError, c.transform_point_to_global, [0., 0., 0., 0.])
-        self.assertRaises(ValueError, c.transform_point_to_global, [[0., 0., 0.]])
+        c = self.c1_rect
+        for bad in BAD_POINTS:
+            with self.subTest(bad=bad):
+                self.assertRaises(ValueError, c.transform_point_to_global, bad)
 
     def test_transform_point_to_global_from_rectangular(self):
 
@@ -184,291 +272,142 @@ class TestCoordinateSystem(TestCase):
         # test one point
         loc_pnt = np.array([-6,4,7], dtype=float)
         glob_pnt = c.transform_point_to_global(loc_pnt)
-        self.assertTrue(np.allclose(glob_pnt, loc_pnt))
+        np.testing.assert_allclose(glob_pnt, loc_pnt, atol=1e-8)
 
         # test multiple points
-        loc_pnts = [[-2.7209705, 9.8683531e-2, 3.685998],
-                    [-1.5682088, 0.77080594,   4.7902588],
-                    [-1.4341189, 2.23157040,   6.477916],
-                    [-6.8625229, 8.44202360,   7.4590895]]
-                    # calculated with ANSYS Workbench Mechanical
+        loc_pnts = C1_PNTS_RECT
         
         glob_pnts = [c.transform_point_to_global(loc_pnt) for loc_pnt in loc_pnts]
 
-        self.assertTrue(np.allclose(glob_pnts, loc_pnts))
+        np.testing.assert_allclose(glob_pnts, loc_pnts, atol=1e-8)
 
         # Test translated and rotated Cosy
         # ------------------------------------------------------------------
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_rect.copy()
         glob_pnts = [c.transform_point_to_global(loc_pnt) for loc_pnt in loc_pnts]
-        glob_pnts_ref = [[ 0., 0., 0.],
-                        [ 1., 1., 1.],
-                        [ 1., 2., 3.],
-                        [-6., 4., 7.]] 
-                    # calculated with ANSYS Workbench Mechanical
+        glob_pnts_ref = GLOB_PNTS
         
-        for p1, p2 in zip(glob_pnts, glob_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_pnts, glob_pnts_ref, atol=1e-6)
 
     def test_transform_point_to_global_from_cylindrical(self):
 
         c = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
 
         # test one point
-        loc_pnt = [7.2111026, np.deg2rad(146.30993), 7.]
-        # calculated with ANSYS Workbench Mechanical
+        loc_pnt = GLOB_PNTS_CYL[-1]
 
         glob_pnt = c.transform_point_to_global(loc_pnt)
         glob_pnt_ref = np.array([-6,4,7], dtype=float)
                       
-        for c1, c2 in zip(glob_pnt, glob_pnt_ref):
-            self.assertAlmostEqual(c1, c2, 6) #type: ignore
+        np.testing.assert_allclose(glob_pnt, glob_pnt_ref, atol=1e-6)
 
         # test multiple points
-        loc_pnts = [[0.,	0.,	0.],
-                    [1.4142136,	np.deg2rad(45.),	1.],
-                    [2.236068,	np.deg2rad(63.434949),	3.],
-                    [7.2111026,	np.deg2rad(146.30993),	7.]]
-                    # calculated with ANSYS Workbench Mechanical
-        
-        glob_pnts = [c.transform_point_to_global(loc_pnt) for loc_pnt in loc_pnts]
+        glob_pnts = c.transform_points_to_global(np.asarray(GLOB_PNTS_CYL))
 
-        glob_pnts_ref = [[ 0., 0., 0.],
-                        [ 1., 1., 1.],
-                        [ 1., 2., 3.],
-                        [-6., 4., 7.]]
+        glob_pnts_ref = GLOB_PNTS
 
-        for p1, p2 in zip(glob_pnts, glob_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_pnts, glob_pnts_ref, atol=1e-6)
 
         # Test translated and rotated Cosy
         # ------------------------------------------------------------------
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
-
-        loc_pnts = [[2.7227594,	np.deg2rad(177.92292),	3.685998],
-                    [1.747404,	np.deg2rad(153.82496),	4.7902588],
-                    [2.6526597,	np.deg2rad(122.72683),	6.477916],
-                    [10.879429,	np.deg2rad(129.10767),	7.4590895]] 
-                    # calculated with ANSYS Workbench Mechanical
-        
-        glob_pnts = [c.transform_point_to_global(loc_pnt) for loc_pnt in loc_pnts]
-
-        for p1, p2 in zip(glob_pnts, glob_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_point_to_other_from_rectangular_to_rectangular(self):
-
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_pnts = [[-2.7209705, 9.8683531e-2, 3.685998],
-                    [-1.5682088, 0.77080594,   4.7902588],
-                    [-1.4341189, 2.23157040,   6.477916],
-                    [-6.8625229, 8.44202360,   7.4590895]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts_ref =  [[-1.4552322,    1.8868577, -9.6084373],
-                        [-6.7625066e-2, 2.3583302, -8.6852579],
-                        [ 0.85277961,   4.1644548, -7.7414523],
-                        [-0.75323817,  11.884473, -10.353354]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts = [c1.transform_point_to_other(c1_pnt, c2) for c1_pnt in c1_pnts]
-        
-        for p1, p2 in zip(c2_pnts, c2_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_point_to_other_from_rectangular_to_cylindrical(self):
-
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_pnts = [[-2.7209705, 9.8683531e-2, 3.685998],
-                    [-1.5682088, 0.77080594,   4.7902588],
-                    [-1.4341189, 2.23157040,   6.477916],
-                    [-6.8625229, 8.44202360,   7.4590895]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts_ref = [[2.3828414,	np.deg2rad(127.64108),	-9.6084373],
-                        [2.3592996,	np.deg2rad(91.642505),	-8.6852579],
-                        [4.2508725,	np.deg2rad(78.427201),	-7.7414523],
-                        [11.908319,	np.deg2rad(93.626557),	-10.353354]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts = [c1.transform_point_to_other(c1_pnt, c2) for c1_pnt in c1_pnts]
-        
-        for p1, p2 in zip(c2_pnts, c2_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_point_to_other_from_cylindrical_to_rectangular(self):
-
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_pnts = [[2.7227594,	np.deg2rad(177.92292),	3.685998],
-                    [1.747404, np.deg2rad(153.82496),	4.7902588],
-                    [2.6526597,	np.deg2rad(122.72683),	6.477916],
-                    [10.879429,	np.deg2rad(129.10767),	7.4590895]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts_ref =  [[-1.4552322,    1.8868577, -9.6084373],
-                        [-6.7625066e-2, 2.3583302, -8.6852579],
-                        [ 0.85277961,   4.1644548, -7.7414523],
-                        [-0.75323817,  11.884473, -10.353354]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts = [c1.transform_point_to_other(c1_pnt, c2) for c1_pnt in c1_pnts]
-        
-        for p1, p2 in zip(c2_pnts, c2_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 5)
-
-    def test_transform_point_to_other_from_cylindrical_to_cylindrical(self):
-
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_pnts = [[2.7227594,	np.deg2rad(177.92292),	3.685998],
-                    [1.747404, np.deg2rad(153.82496),	4.7902588],
-                    [2.6526597,	np.deg2rad(122.72683),	6.477916],
-                    [10.879429,	np.deg2rad(129.10767),	7.4590895]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts_ref = [[2.3828414,	np.deg2rad(127.64108),	-9.6084373],
-                        [2.3592996,	np.deg2rad(91.642505),	-8.6852579],
-                        [4.2508725,	np.deg2rad(78.427201),	-7.7414523],
-                        [11.908319,	np.deg2rad(93.626557),	-10.353354]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_pnts = [c1.transform_point_to_other(c1_pnt, c2) for c1_pnt in c1_pnts]
-        
-        for p1, p2 in zip(c2_pnts, c2_pnts_ref):
-            for c1, c2 in zip(p1, p2):
-                self.assertAlmostEqual(c1, c2, 5)
+        c = self.c1_cyl.copy()
+
+        glob_pnts = c.transform_points_to_global(np.asarray(C1_PNTS_CYL))
+
+        np.testing.assert_allclose(glob_pnts, glob_pnts_ref, atol=1e-6)
+
+    def test_transform_point_to_other(self):
+        # every combination of the shared systems C1 and C2
+        cases = [
+            # (c1,          c2,           c1_pnts,      c2_pnts_ref,  atol)
+            (self.c1_rect, self.c2_rect, C1_PNTS_RECT, C2_PNTS_RECT, 1e-6),
+            (self.c1_rect, self.c2_cyl,  C1_PNTS_RECT, C2_PNTS_CYL,  1e-6),
+            (self.c1_cyl,  self.c2_rect, C1_PNTS_CYL,  C2_PNTS_RECT, 1e-5),
+            (self.c1_cyl,  self.c2_cyl,  C1_PNTS_CYL,  C2_PNTS_CYL,  1e-5),
+        ]
+        for c1, c2, c1_pnts, c2_pnts_ref, atol in cases:
+            with self.subTest(c1=c1.type.name, c2=c2.type.name):
+                c2_pnts = c1.transform_points_to_other(c1_pnts, c2)
+                np.testing.assert_allclose(c2_pnts, c2_pnts_ref, atol=atol)
+
+                # single point
+                c2_pnt = c1.transform_point_to_other(c1_pnts[-1], c2)
+                np.testing.assert_allclose(c2_pnt, c2_pnts_ref[-1], atol=atol)
 
     def test_transform_vector_from_global_into_rectangular(self):
 
-        c = CoordinateSystem('C1')
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_rect.copy()
         # test one point
         glob_vec = [1.,1.,1.]
         loc_vec = c.transform_vector_from_global(glob_vec)
         loc_vec_ref = [1.1527617, 0.67212241, 1.1042608]
 
-        for c1, c2 in zip(loc_vec, loc_vec_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_vec, loc_vec_ref, atol=1e-6)
 
         # # test multiple points
         glob_vecs = [[1.,1.,1.],[3.,4.,5.]]
-        loc_vec = [c.transform_vector_from_global(glob_vec) for glob_vec in glob_vecs]
+        loc_vec = c.transform_vectors_from_global(glob_vecs)
         loc_vec_ref = [[1.1527617, 0.67212241, 1.1042608],
                        [3.592375, 3.4771317, 5.0004397]]
-        for v1, v2 in zip(loc_vec, loc_vec_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_vec, loc_vec_ref, atol=1e-6)
 
     def test_transform_vector_from_global_into_cylindrical(self):
 
-        c = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_cyl.copy()
         # test one vector, one ref point
         glob_vec = [1.,1.,1.]
         glob_pnt = [-6.,4.,7.]
         loc_vec = c.transform_vector_from_global(glob_vec, glob_pnt)
         loc_vec_ref = [-0.2055972, -1.3184604, 1.1042608]
 
-        for c1, c2 in zip(loc_vec, loc_vec_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_vec, loc_vec_ref, atol=1e-6)
 
         # test multiple vectors, one ref point
         glob_vecs = [[1.,1.,1.],[3.,4.,5.]]
         glob_pnt = [-6.,4.,7.]
-        loc_vec = [c.transform_vector_from_global(glob_vec, glob_pnt) for glob_vec in glob_vecs]
+        loc_vec = c.transform_vectors_from_global(glob_vecs, glob_pnt)
         loc_vec_ref = [[-0.2055972, -1.3184604, 1.1042608],
                        [0.43212494, -4.9808504, 5.0004397]]
-        for v1, v2 in zip(loc_vec, loc_vec_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_vec, loc_vec_ref, atol=1e-6)
 
         # test multiple vectors, multiple ref points
         glob_vecs = [[1.,1.,1.],[3.,4.,5.]]
         glob_pnts = [[-6.,4.,7.], [-6.,4.,7.]]
-        loc_vec = [c.transform_vector_from_global(glob_vec, glob_pnt) 
-                   for glob_vec, glob_pnt in zip(glob_vecs, glob_pnts)]
-        
+        loc_vec = c.transform_vectors_from_global(glob_vecs, glob_pnts)
+
         loc_vec_ref = [[-0.2055972, -1.3184604, 1.1042608],
                        [0.43212494, -4.9808504, 5.0004397]]
-        for v1, v2 in zip(loc_vec, loc_vec_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_vec, loc_vec_ref, atol=1e-6)
+
+    def test_transform_vectors_from_global_exception(self):
+        c = self.c1_cyl.copy()
+        glob_vecs = [[1.,1.,1.],[3.,4.,5.]]
+        self.assertRaises(ValueError, c.transform_vectors_from_global, glob_vecs)
+        self.assertRaises(ValueError, c.transform_vectors_from_global, glob_vecs, [[-6.,4.,7.]])
+        self.assertRaises(ValueError, c.transform_vectors_from_global, [1.,1.,1.], [-6.,4.,7.])
+
+    def test_transform_vectors_to_global(self):
+        c = self.c1_cyl.copy()
+        loc_vecs = [[-0.2055972, -1.3184604, 1.1042608],
+                    [0.43212494, -4.9808504, 5.0004397]]
+        glob_vecs = c.transform_vectors_to_global(loc_vecs, C1_PNTS_CYL[-1])
+        np.testing.assert_allclose(glob_vecs, [[1.,1.,1.],[3.,4.,5.]], atol=1e-6)
+
+        c = self.c1_rect.copy()
+        loc_vecs = [[1.1527617, 0.67212241, 1.1042608],
+                    [3.592375, 3.4771317, 5.0004397]]
+        glob_vecs = c.transform_vectors_to_global(loc_vecs)
+        np.testing.assert_allclose(glob_vecs, [[1.,1.,1.],[3.,4.,5.]], atol=1e-6)
 
     def test_transform_vector_to_global_from_rectangular(self):
 
-        c = CoordinateSystem('C1')
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_rect.copy()
         # test one point
         loc_vec = [1.1527617, 0.67212241, 1.1042608]
         glob_vec = c.transform_vector_to_global(loc_vec)
         glob_vec_ref = [1.,1.,1.]
         
-        for c1, c2 in zip(glob_vec, glob_vec_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_vec, glob_vec_ref, atol=1e-6)
 
         # test multiple points
         loc_vecs = [[1.1527617, 0.67212241, 1.1042608],
@@ -476,295 +415,157 @@ class TestCoordinateSystem(TestCase):
         glob_vecs = [c.transform_vector_to_global(loc_vec) for loc_vec in loc_vecs]
         glob_vecs_ref = [[1.,1.,1.],[3.,4.,5.]]
 
-        for v1, v2 in zip(glob_vecs, glob_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_vecs, glob_vecs_ref, atol=1e-6)
 
     def test_transform_vector_to_global_from_cylindrical(self):
 
-        c = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_cyl.copy()
         # test one vector, one ref point
         loc_vec = [-0.2055972, -1.3184604, 1.1042608]
-        loc_pnt = [10.879429,	np.deg2rad(129.10767),	7.4590895]
+        loc_pnt = C1_PNTS_CYL[-1]
         glob_vec = c.transform_vector_to_global(loc_vec, loc_pnt)
         glob_vec_ref = [1.,1.,1.]
-        for c1, c2 in zip(glob_vec, glob_vec_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_vec, glob_vec_ref, atol=1e-6)
 
         # test multiple vectors, one ref point     
         loc_vecs = [[-0.2055972, -1.3184604, 1.1042608],
                        [0.43212494, -4.9808504, 5.0004397]]
-        loc_pnt = [10.879429,	np.deg2rad(129.10767),	7.4590895]
+        loc_pnt = C1_PNTS_CYL[-1]
         glob_vecs = [c.transform_vector_to_global(loc_vec, loc_pnt) for loc_vec in loc_vecs]
         glob_vecs_ref = [[1.,1.,1.],[3.,4.,5.]]
-        for v1, v2 in zip(glob_vecs, glob_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_vecs, glob_vecs_ref, atol=1e-6)
 
         # test multiple vectors, multiple ref points
         
         loc_vecs = [[-0.2055972, -1.3184604, 1.1042608],
                     [0.43212494, -4.9808504, 5.0004397]]
-        loc_pnts = [[10.879429,	np.deg2rad(129.10767),	7.4590895], 
-                     [10.879429,	np.deg2rad(129.10767),	7.4590895]]
+        loc_pnts = [C1_PNTS_CYL[-1], 
+                     C1_PNTS_CYL[-1]]
         glob_vecs = [c.transform_vector_to_global(loc_vec, loc_pnt) 
                    for loc_vec, loc_pnt in zip(loc_vecs, loc_pnts)]
         glob_vecs_ref = [[1.,1.,1.],[3.,4.,5.]]
 
-        for v1, v2 in zip(glob_vecs, glob_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_vector_to_other_from_rectangular_to_rectangular(self):
-
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_vecs = [[6, 7, 8],
-                   [6, -7, 8]]
-
-        c2_vecs_ref =  [[9.060223, 6.1417899, 5.4028489],
-                        [2.1604354, -4.6338814, 11.084208]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_vecs = [c1.transform_vector_to_other(c2, c1_vec) for c1_vec in c1_vecs]
-        
-        for v1, v2 in zip(c2_vecs, c2_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_vector_to_other_from_rectangular_to_cylindrical(self):
-
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        ref_point = [-6.8625229, 8.4420236, 7.4590895]
-        # ref point in c1 at global [-6, 4, 7]. Transformed with ANSYS Workbench Mechanical
+        np.testing.assert_allclose(glob_vecs, glob_vecs_ref, atol=1e-6)
 
+    def test_transform_vector_to_other(self):
+        # every combination of the shared systems C1 and C2.
+        # ref points in C1 at global [-6, 4, 7]
         c1_vecs = [[6, 7, 8],
                    [6, -7, 8]]
-
-        c2_vecs_ref =  [[5.5564038, -9.4305674, 5.4028489],
-                        [-4.7612564, -1.8630018, 11.084208]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_vecs = [c1.transform_vector_to_other(c2, c1_vec, ref_point) for c1_vec in c1_vecs]
-        
-        for v1, v2 in zip(c2_vecs, c2_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 6)
-
-    def test_transform_vector_to_other_from_cylindrical_to_rectangular(self):
-
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        ref_point = [10.879429,	np.deg2rad(129.10767),	7.4590895]
-        # ref point in c1_cyl at global [-6, 4, 7]. Transformed with ANSYS Workbench Mechanical
-
-        c1_vecs = [[6, 7, 8],
-                   [6, -7, 8]]
-
-        c2_vecs_ref =  [[-7.4896431, 7.9677196, 5.4240843],
-                        [6.2996349, 9.7467169, 3.7836636]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_vecs = [c1.transform_vector_to_other(c2, c1_vec, ref_point) for c1_vec in c1_vecs]
-        
-        for v1, v2 in zip(c2_vecs, c2_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 5)
-
-    def test_transform_vector_to_other_from_cylindrical_to_cylindrical(self):
-
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        ref_point = [10.879429,	np.deg2rad(129.10767),	7.4590895]
-        # ref point in c1_cyl at global [-6, 4, 7]. Transformed with ANSYS Workbench Mechanical
-
-        c1_vecs = [[6, 7, 8],
-                   [6, -7, 8]]
-
-        c2_vecs_ref =  [[8.4255076, 6.9706622, 5.4240843],
-                        [9.3287278, -6.9035301, 3.7836636]]
-                    # calculated with ANSYS Workbench Mechanical
-
-        c2_vecs = [c1.transform_vector_to_other(c2, c1_vec, ref_point) for c1_vec in c1_vecs]
-        
-        for v1, v2 in zip(c2_vecs, c2_vecs_ref):
-            for c1, c2 in zip(v1, v2):
-                self.assertAlmostEqual(c1, c2, 5)
+        cases = [
+            # (c1, c2, ref_point, c2_vecs_ref, atol)
+            # c2_vecs_ref calculated with ANSYS Workbench Mechanical
+            (self.c1_rect, self.c2_rect, None,
+             [[9.060223, 6.1417899, 5.4028489],
+              [2.1604354, -4.6338814, 11.084208]], 1e-6),
+            (self.c1_rect, self.c2_cyl, C1_PNTS_RECT[-1],
+             [[5.5564038, -9.4305674, 5.4028489],
+              [-4.7612564, -1.8630018, 11.084208]], 1e-6),
+            (self.c1_cyl, self.c2_rect, C1_PNTS_CYL[-1],
+             [[-7.4896431, 7.9677196, 5.4240843],
+              [6.2996349, 9.7467169, 3.7836636]], 1e-5),
+            (self.c1_cyl, self.c2_cyl, C1_PNTS_CYL[-1],
+             [[8.4255076, 6.9706622, 5.4240843],
+              [9.3287278, -6.9035301, 3.7836636]], 1e-5),
+        ]
+        for c1, c2, ref_point, c2_vecs_ref, atol in cases:
+            with self.subTest(c1=c1.type.name, c2=c2.type.name):
+                c2_vecs = [c1.transform_vector_to_other(c2, c1_vec, ref_point) for c1_vec in c1_vecs]
+                np.testing.assert_allclose(c2_vecs, c2_vecs_ref, atol=atol)
 
     def test_transform_tensor_from_global_into_rectangular(self):
 
-        c = CoordinateSystem('C1')
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_rect.copy()
         # test as vector
-        glob_tens = [0., -1., 0., 0., 0.,0.]
+        glob_tens = GLOB_TENS
         loc_tens = c.transform_tensor_from_global(glob_tens)
-        loc_tens_ref = [-0.29575993, -0.6776137, -2.6626378e-002, -0.44767285, 0.134322, 8.8741284e-002]
+        loc_tens_ref = C1_TENS_RECT
 
-        for c1, c2 in zip(loc_tens, loc_tens_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_tens, loc_tens_ref, atol=1e-6)
 
         # test as matrix
-        glob_tens = [[0, 0, 0],
-                     [0,-1, 0],
-                     [0, 0, 0]]
+        glob_tens = GLOB_TENS_MAT
         loc_tens = c.transform_tensor_from_global(glob_tens)
-        loc_tens_ref = [[-0.29575993, -0.44767285, 0.088741284],
-                        [-0.44767285, -0.6776137,  0.134322],
-                        [0.088741284,  0.134322,  -0.026626378]]
+        loc_tens_ref = C1_TENS_RECT_MAT
         
-        for row, row_ref in zip(loc_tens, loc_tens_ref):
-            for c1, c2 in zip(row, row_ref):
-                self.assertAlmostEqual(c1, c2, 6) 
+        np.testing.assert_allclose(loc_tens, loc_tens_ref, atol=1e-6)
+
+        # test batch of vectors and matrices against R.T.R^T contraction
+        glob_tens = np.array([[0., -1., 0., 0., 0., 0.],
+                              [1., 2., 3., 4., 5., 6.],
+                              [-3., 0.5, 2., -1., 0., 7.]])
+        xx, yy, zz, xy, yz, zx = glob_tens.T
+        glob_mats = np.stack([np.stack([xx, xy, zx], -1),
+                              np.stack([xy, yy, yz], -1),
+                              np.stack([zx, yz, zz], -1)], 1)
+        r = c.get_matrix()
+        loc_mats_ref = np.einsum('ij,njk,lk->nil', r, glob_mats, r)
+        loc_tens_ref = loc_mats_ref[:, [0, 1, 2, 0, 1, 0], [0, 1, 2, 1, 2, 2]]
+
+        np.testing.assert_allclose(c.transform_tensors_from_global(glob_mats), loc_mats_ref, atol=1e-12)
+        np.testing.assert_allclose(c.transform_tensors_from_global(glob_tens), loc_tens_ref, atol=1e-12)
 
     def test_transform_tensor_from_global_into_cylindrical(self):
 
-        c = CoordinateSystem('C1', type= EOrientationSystems.CYLINDRICAL)
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_cyl.copy()
         # test as vector
-        glob_tens = [0., -1., 0., 0., 0.,0.]
+        glob_tens = GLOB_TENS
         ref_pnt = [30,30,30]
         loc_tens = c.transform_tensor_from_global(glob_tens, ref_pnt)
-        loc_tens_ref = [-0.81114565, -0.16222797, -2.6626378e-002, -0.36275406, 6.5723232e-002, 0.14696214]
+        loc_tens_ref = C1_TENS_CYL
 
-        for c1, c2 in zip(loc_tens, loc_tens_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(loc_tens, loc_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_global_from_rectangular(self):
 
-        c = CoordinateSystem('C1')
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_rect.copy()
         # test as vector
-        glob_tens_ref = [0., -1., 0., 0., 0.,0.]
-        loc_tens = [-0.29575993, -0.6776137, -2.6626378e-002, -0.44767285, 0.134322, 8.8741284e-002]
+        glob_tens_ref = GLOB_TENS
+        loc_tens = C1_TENS_RECT
         glob_tens = c.transform_tensor_to_global(loc_tens)
         
 
-        for c1, c2 in zip(glob_tens, glob_tens_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_tens, glob_tens_ref, atol=1e-6)
 
         # test as matrix
-        glob_tens_ref = [[0, 0, 0],
-                        [0,-1, 0],
-                        [0, 0, 0]]
-        loc_tens = [[-0.29575993, -0.44767285, 0.088741284],
-                        [-0.44767285, -0.6776137,  0.134322],
-                        [0.088741284,  0.134322,  -0.026626378]]
+        glob_tens_ref = GLOB_TENS_MAT
+        loc_tens = C1_TENS_RECT_MAT
         glob_tens = c.transform_tensor_to_global(loc_tens)
         
-        for row, row_ref in zip(glob_tens, glob_tens_ref):
-            for c1, c2 in zip(row, row_ref):
-                self.assertAlmostEqual(c1, c2, 6) 
+        np.testing.assert_allclose(glob_tens, glob_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_global_from_cylindrical(self):
 
-        c = CoordinateSystem('C1', type= EOrientationSystems.CYLINDRICAL)
-        c.move([1., 2., -4.])
-        c.rotate_x(10, degrees=True)
-        c.rotate_y(20, degrees=True)
-        c.rotate_z(30, degrees=True)
+        c = self.c1_cyl.copy()
         # test as vector
-        glob_tens_ref = [0., -1., 0., 0., 0.,0.]
-        ref_pnt = [37.759005, 0.56643013, 36.813822]
-        loc_tens = [-0.81114565, -0.16222797, -2.6626378e-002, -0.36275406, 6.5723232e-002, 0.14696214]
+        glob_tens_ref = GLOB_TENS
+        ref_pnt = C1_TENS_CYL_REF_PNT
+        loc_tens = C1_TENS_CYL
         glob_tens = c.transform_tensor_to_global(loc_tens, ref_pnt)
         
 
-        for c1, c2 in zip(glob_tens, glob_tens_ref):
-            self.assertAlmostEqual(c1, c2, 6)
+        np.testing.assert_allclose(glob_tens, glob_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_other_from_rectangular_to_rectangular(self):
 
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
+        c1 = self.c1_rect.copy()
+        c2 = self.c2_rect.copy()
 
-        c1_tens = [-0.29575993, -0.6776137, -2.6626378e-002, -0.44767285, 0.134322, 8.8741284e-002]
+        c1_tens = C1_TENS_RECT
 
         c2_tens_ref =  [-0.75690331, -9.6390665e-002, -0.14670602, -0.27010815, 0.11891632, 0.33323006]
                     # calculated with ANSYS Workbench Mechanical
 
         c2_tens = c1.transform_tensor_to_other(c2, c1_tens)
         
-        for v1, v2 in zip(c2_tens, c2_tens_ref):
-            self.assertAlmostEqual(v1, v2, 6)
+        np.testing.assert_allclose(c2_tens, c2_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_other_from_rectangular_to_cylindrical(self):
 
-        c1 = CoordinateSystem('C1')
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_tens = [-0.29575993, -0.6776137, -2.6626378e-002, -0.44767285, 0.134322, 8.8741284e-002]
+        c1 = self.c1_rect.copy()
+        c2 = self.c2_cyl.copy()
+
+        c1_tens = C1_TENS_RECT
         ref_pnt = [31.86188, 20.262356, 36.813822]
 
 
@@ -773,53 +574,157 @@ class TestCoordinateSystem(TestCase):
 
         c2_tens = c1.transform_tensor_to_other(c2, c1_tens, ref_pnt)
         
-        for v1, v2 in zip(c2_tens, c2_tens_ref):
-            self.assertAlmostEqual(v1, v2, 6)
+        np.testing.assert_allclose(c2_tens, c2_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_other_from_cylindrical_to_rectangular(self):
 
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
+        c1 = self.c1_cyl.copy()
+        c2 = self.c2_rect.copy()
 
-        c2 = CoordinateSystem('C2')
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
-
-        c1_tens = [-0.81114565, -0.16222797, -2.6626378e-002, -0.36275406, 6.5723232e-002, 0.14696214]
-        ref_pnt = [37.759005, 0.56643013, 36.813822]
+        c1_tens = C1_TENS_CYL
+        ref_pnt = C1_TENS_CYL_REF_PNT
         c2_tens_ref =  [-0.75690331, -9.6390665e-002, -0.14670602, -0.27010815, 0.11891632, 0.33323006]
                     # calculated with ANSYS Workbench Mechanical
 
         c2_tens = c1.transform_tensor_to_other(c2, c1_tens, ref_pnt)
         
-        for v1, v2 in zip(c2_tens, c2_tens_ref):
-            self.assertAlmostEqual(v1, v2, 6)
+        np.testing.assert_allclose(c2_tens, c2_tens_ref, atol=1e-6)
 
     def test_transform_tensor_to_other_from_cylindrical_to_cylindrical(self):
 
-        c1 = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
-        c1.move([1., 2., -4.])
-        c1.rotate_x(10, degrees=True)
-        c1.rotate_y(20, degrees=True)
-        c1.rotate_z(30, degrees=True)
-
-        c2 = CoordinateSystem('C2', type=EOrientationSystems.CYLINDRICAL)
-        c2.move([8., -3., 5.])
-        c2.rotate_x(30, degrees=True)
-        c2.rotate_y(40, degrees=True)
-        c2.rotate_z(50, degrees=True)
+        c1 = self.c1_cyl.copy()
+        c2 = self.c2_cyl.copy()
 
-        c1_tens = [-0.81114565, -0.16222797, -2.6626378e-002, -0.36275406, 6.5723232e-002, 0.14696214]
-        ref_pnt = [37.759005, 0.56643013, 36.813822]
+        c1_tens = C1_TENS_CYL
+        ref_pnt = C1_TENS_CYL_REF_PNT
         c2_tens_ref =  c2_tens_ref =  [-0.85213174, -1.1622426e-003, -0.14670602, 3.1470364e-002, -1.3057871e-002, 0.35357157]
                     # calculated with ANSYS Workbench Mechanical
 
         c2_tens = c1.transform_tensor_to_other(c2, c1_tens, ref_pnt)
         
-        for v1, v2 in zip(c2_tens, c2_tens_ref):
-            self.assertAlmostEqual(v1, v2, 6)
\ No newline at end of file
+        np.testing.assert_allclose(c2_tens, c2_tens_ref, atol=1e-6)
+
+    def test_cache_invalidated_on_change(self):
+
+        c1 = CoordinateSystem('C1')
+        c2 = CoordinateSystem('C2')
+        tens = [0., -1., 0., 0., 0., 0.]
+        c1.transform_point_to_other([1., 2., 3.], c2)
+        c1.transform_tensor_from_global(tens)
+        v1, v2 = c1._version, c2._version
+
+        # changes of both systems must be reflected in following transformations
+        c1.rotate_z(90, degrees=True)
+        c2.move([1., 0., 0.])
+        self.assertGreater(c1._version, v1)
+        self.assertGreater(c2._version, v2)
+
+        c2_pnt = c1.transform_point_to_other([1., 2., 3.], c2)
+        np.testing.assert_allclose([-3., 1., 3.], c2_pnt, atol=1e-8)
+        loc_tens = c1.transform_tensor_from_global(tens)
+        np.testing.assert_allclose([-1., 0., 0., 0., 0., 0.], loc_tens, atol=1e-8)
+
+        # only the last other system is cached and only weakly referenced
+        for _ in range(100):
+            c1.transform_point_to_other([1., 2., 3.], CoordinateSystem('TMP'))
+        self.assertEqual(len(c1._cache), 2) # relative and voigt transform
+        c3 = CoordinateSystem('C3')
+        ref = weakref.ref(c3)
+        c1.transform_point_to_other([1., 2., 3.], c3)
+        del c3
+        self.assertIsNone(ref())
+        np.testing.assert_allclose(c1.transform_point_to_other([1., 2., 3.], c2), c2_pnt, atol=1e-8)
+
+        # returned origin and matrix are copies, changing them doesn't change the systems
+        c2.get_origin()[:] = [5., 5., 5.]
+        c1.get_matrix()[:] = np.eye(3)
+        np.testing.assert_allclose(c2.get_origin(), [1., 0., 0.])
+        np.testing.assert_allclose(c1.transform_point_to_other([1., 2., 3.], c2), c2_pnt, atol=1e-8)
+        np.testing.assert_allclose(c1.transform_tensor_from_global(tens), loc_tens, atol=1e-8)
+
+    def test_transform_tensors_from_global(self):
+
+        c = self.c1_rect.copy()
+        # test as vectors
+        glob_tens = [GLOB_TENS, 2 * GLOB_TENS]
+        loc_tens = c.transform_tensors_from_global(glob_tens)
+        loc_tens_ref = C1_TENS_RECT
+        np.testing.assert_allclose(loc_tens, [loc_tens_ref, 2 * loc_tens_ref], atol=1e-8)
+
+        # test as matrices
+        glob_tens = [GLOB_TENS_MAT] * 2
+        loc_tens = c.transform_tensors_from_global(glob_tens)
+        loc_tens_ref = C1_TENS_RECT_MAT
+        np.testing.assert_allclose(loc_tens, [loc_tens_ref] * 2, atol=1e-8)
+
+        # test cylindrical
+        c.type = EOrientationSystems.CYLINDRICAL
+        glob_tens = [GLOB_TENS] * 2
+        ref_pnts = [[30,30,30]] * 2
+        loc_tens = c.transform_tensors_from_global(glob_tens, ref_pnts)
+        loc_tens_ref = C1_TENS_CYL
+        np.testing.assert_allclose(loc_tens, [loc_tens_ref] * 2, atol=1e-8)
+
+        self.assertRaises(ValueError, c.transform_tensors_from_global, glob_tens)
+        self.assertRaises(ValueError, c.transform_tensors_from_global, glob_tens, [[30,30,30]])
+        self.assertRaises(ValueError, c.transform_tensors_from_global, GLOB_TENS)
+
+    def test_transform_tensors_to_global(self):
+
+        c = self.c1_cyl.copy()
+        glob_tens_ref = GLOB_TENS
+        ref_pnts = [C1_TENS_CYL_REF_PNT] * 2
+        loc_tens = [C1_TENS_CYL] * 2
+        glob_tens = c.transform_tensors_to_global(loc_tens, ref_pnts)
+        np.testing.assert_allclose(glob_tens, [glob_tens_ref] * 2, atol=1e-6)
+
+    def test_transform_points_from_global(self):
+
+        c = self.c1_cyl.copy()
+        glob_pnts = GLOB_PNTS
+        loc_pnts_ref = C1_PNTS_CYL
+        loc_pnts = c.transform_points_from_global(glob_pnts)
+        np.testing.assert_allclose(loc_pnts, loc_pnts_ref, atol=1e-8)
+        np.testing.assert_allclose(c.transform_points_to_global(loc_pnts), glob_pnts, atol=1e-8)
+
+        # large number of points
+        glob_pnts = np.tile(glob_pnts, (3000, 1))
+        loc_pnts = c.transform_points_from_global(glob_pnts)
+        np.testing.assert_allclose(loc_pnts, np.tile(loc_pnts_ref, (3000, 1)), atol=1e-8)
+        np.testing.assert_allclose(c.transform_points_to_global(loc_pnts), glob_pnts, atol=1e-8)
+
+        # large number of points with a left handed and a non orthonormal matrix
+        for mat in (np.diag([1., 1., -1.]), 2 * np.round(self.c1_rect.get_matrix(), 5)):
+            c = CoordinateSystem('C2', matrix=mat)
+            c.move([1., 2., -4.])
+            loc_pnts = c.transform_points_from_global(glob_pnts)
+            loc_pnts_ref = [c.transform_point_from_global(p) for p in GLOB_PNTS]
+            np.testing.assert_allclose(loc_pnts, np.tile(loc_pnts_ref, (3000, 1)), atol=1e-8)
+            glob_pnts_ref = [c.transform_point_to_global(p) for p in loc_pnts[:len(GLOB_PNTS)]]
+            np.testing.assert_allclose(c.transform_points_to_global(loc_pnts), np.tile(glob_pnts_ref, (3000, 1)), atol=1e-8)
+
+        self.assertRaises(ValueError, c.transform_points_from_global, [0., 0., 0.])
+        self.assertRaises(ValueError, c.transform_points_to_global, [[0., 0.]])
+
+    def test_transform_points_out_param(self):
+
+        c = CoordinateSystem('C1', type=EOrientationSystems.CYLINDRICAL)
+        c.move([1., 2., -4.])
+        c.rotate_x(10, degrees=True)
+        glob_pnts = GLOB_PNTS.copy()
+        loc_pnts_ref = c.transform_points_from_global(glob_pnts)
+
+        out = np.empty((4, 3))
+        loc_pnts = c.transform_points_from_global(glob_pnts, out=out)
+        self.assertIs(loc_pnts, out)
+        np.testing.assert_allclose(loc_pnts_ref, out, atol=1e-8)
+
+        # in place
+        pnts = glob_pnts.copy()
+        c.transform_points_from_global(pnts, out=pnts)
+        np.testing.assert_allclose(loc_pnts_ref, pnts, atol=1e-8)
+        c.transform_points_to_global(pnts, out=pnts)
+        np.testing.assert_allclose(glob_pnts, pnts, atol=1e-8)
+
+        self.assertRaises(ValueError, c.transform_points_from_global, glob_pnts, np.empty((3, 3)))
+        self.assertRaises(ValueError, c.transform_points_from_global, glob_pnts, np.empty((4, 3), dtype=np.float32))
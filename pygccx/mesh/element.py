@@ -18,19 +18,28 @@ If not, see <http://www.gnu.org/licenses/>.
 '''
 
 from dataclasses import dataclass, field
-from typing import Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Iterator, NamedTuple
+import numpy as np
 from pygccx.enums import EEtypes
 
-FACE_INDEX_TABLE = {
-    EEtypes.C3D4:  ((0,1,2),   (0,3,1),   (1,3,2),   (2,3,0)),
-    EEtypes.C3D8I: ((0,1,2,3), (4,7,6,5), (0,4,5,1), (1,5,6,2), (2,6,7,3), (3,7,4,0)),
-    EEtypes.C3D6:  ((0,1,2),   (3,4,5),   (0,1,4,3), (1,2,5,4), (2,0,3,5)),
-    EEtypes.C3D10: ((0,1,2),   (0,3,1),   (1,3,2),   (2,3,0)),
-    EEtypes.C3D20R:((0,1,2,3), (4,7,6,5), (0,4,5,1), (1,5,6,2), (2,6,7,3), (3,7,4,0)), 
-    EEtypes.C3D15: ((0,1,2),   (3,4,5),   (0,1,4,3), (1,2,5,4), (2,0,3,5)),
-}
-
-NODE_COUNT_TABLE = {
+# Node indices of the faces of tetrahedral, hexahedral and wedge elements.
+# Quadratic elements share the faces of their linear counterpart (corner nodes only).
+_TET_FACES =   ((0,1,2),   (0,3,1),   (1,3,2),   (2,3,0))
+_HEX_FACES =   ((0,1,2,3), (4,7,6,5), (0,4,5,1), (1,5,6,2), (2,6,7,3), (3,7,4,0))
+_WEDGE_FACES = ((0,1,2),   (3,4,5),   (0,1,4,3), (1,2,5,4), (2,0,3,5))
+
+FACE_INDEX_TABLE = MappingProxyType({
+    EEtypes.C3D4:   _TET_FACES,
+    EEtypes.C3D8I:  _HEX_FACES,
+    EEtypes.C3D6:   _WEDGE_FACES,
+    EEtypes.C3D10:  _TET_FACES,
+    EEtypes.C3D20R: _HEX_FACES, 
+    EEtypes.C3D15:  _WEDGE_FACES,
+})
+
+NODE_COUNT_TABLE = MappingProxyType({
     EEtypes.SPRING1: 1,
     EEtypes.DCOUP3D: 1,
     EEtypes.MASS:    1,
@@ -49,9 +58,9 @@ NODE_COUNT_TABLE = {
     EEtypes.C3D20:  20,
     EEtypes.C3D20R: 20,
     EEtypes.C3D15:  15,
-}
+})
 
-CORNER_NODE_COUNT_TABLE = {
+CORNER_NODE_COUNT_TABLE = MappingProxyType({
     EEtypes.SPRING1: 1,
     EEtypes.DCOUP3D: 1,
     EEtypes.MASS:    1,
@@ -70,7 +79,28 @@ CORNER_NODE_COUNT_TABLE = {
     EEtypes.C3D20:  8,
     EEtypes.C3D20R: 8,
     EEtypes.C3D15:  6,
-}
+})
+
+DIMENSION_TABLE = MappingProxyType({
+    EEtypes.SPRING1: 0,
+    EEtypes.DCOUP3D: 0,
+    EEtypes.MASS:    0,
+
+    EEtypes.GAPUNI:  1,
+    EEtypes.DASHPOTA: 1,
+    EEtypes.SPRING2: 1,
+    EEtypes.SPRINGA: 1,
+
+    EEtypes.C3D4:   3,
+    EEtypes.C3D8:   3,
+    EEtypes.C3D8R:  3,
+    EEtypes.C3D8I:  3,
+    EEtypes.C3D6:   3,
+    EEtypes.C3D10:  3,
+    EEtypes.C3D20:  3,
+    EEtypes.C3D20R: 3,
+    EEtypes.C3D15:  3,
+})
 
 def get_element_dimension(type:EEtypes) -> int:
     """
@@ -88,16 +118,77 @@ def get_element_dimension(type:EEtypes) -> int:
         int: dimension
     """
 
-    if type in (EEtypes.SPRING1, EEtypes.DCOUP3D, EEtypes.MASS):
-        return 0
-    elif type in (EEtypes.GAPUNI,EEtypes.DASHPOTA,EEtypes.SPRING2, EEtypes.SPRINGA):
-        return 1
-    elif type in (EEtypes.C3D4, EEtypes.C3D8, EEtypes.C3D8R, EEtypes.C3D8I, EEtypes.C3D6, 
-                   EEtypes.C3D10, EEtypes.C3D20, EEtypes.C3D20R, EEtypes.C3D15):
-        return 3
-    raise ValueError(f'unknown etype, got{type}')
+    try:
+        return DIMENSION_TABLE[type]
+    except KeyError:
+        raise ValueError(f'unknown etype, got {type}') from None
+
+FACE_RECORD_DTYPE = np.dtype([('number', 'i4'), ('element_id', 'i4'), ('node_ids', 'i4', (4,))])
+"""
+Structured dtype of face records. number is the face number inside the element,
+node_ids holds the node ids of the face, padded with -1 for faces with 3 nodes.
+"""
+
+def _pad_face_indices(faces:tuple[tuple[int, ...], ...]) -> np.ndarray:
+    # node indices of all faces as (number of faces, 4) array padded with -1
+    mat = np.full((len(faces), 4), -1, dtype=np.intp)
+    for row, inds in zip(mat, faces):
+        row[:len(inds)] = inds
+    return mat
+
+_PADDED_FACE_INDICES = {faces: _pad_face_indices(faces) for faces in (_TET_FACES, _HEX_FACES, _WEDGE_FACES)}
+_FACE_INDEX_MATRICES = MappingProxyType({etype: _PADDED_FACE_INDICES[faces] for etype, faces in FACE_INDEX_TABLE.items()})
+
+def build_face_connectivity(conn:np.ndarray, etype:EEtypes) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds the face connectivity of n elements with the same type at once.
 
-@dataclass()
+    Args:
+        conn (np.ndarray): Node ids of the elements with shape (n, number of nodes per element).
+            I.e. from Mesh.get_connectivity
+        etype (EEtypes): Element type of all elements in conn
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: 
+            Node ids of the faces with shape (n * number of faces, 4), padded with -1 for
+            faces with 3 nodes; face numbers with shape (n * number of faces,);
+            row index into conn of the element each face belongs to with the same shape.
+            The faces of element i are the rows i * number of faces to (i + 1) * number of faces - 1.
+            Element types without faces return empty arrays.
+    """
+    conn = np.asarray(conn)
+    n = len(conn)
+    mat = _FACE_INDEX_MATRICES.get(etype)
+    if mat is None:
+        return np.empty((0, 4), dtype=conn.dtype), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.intp)
+    no_faces = len(mat)
+    face_nids = conn[:, mat].reshape(n * no_faces, 4)
+    face_nids[np.tile(mat < 0, (n, 1))] = -1
+    numbers = np.tile(np.arange(1, no_faces + 1, dtype=np.int32), n)
+    elem_inds = np.repeat(np.arange(n), no_faces)
+    return face_nids, numbers, elem_inds
+
+class _ElementSpec(NamedTuple):
+    # properties shared by all elements of one type
+    dim:int
+    node_count:int
+    corner_node_count:int
+    face_getters:tuple[itemgetter, ...]|None
+    """One itemgetter per face, returning the node ids of the face from node_ids"""
+
+# faces have at least 3 nodes, so every itemgetter returns a tuple
+_FACE_GETTERS = {faces: tuple(itemgetter(*inds) for inds in faces) 
+                 for faces in (_TET_FACES, _HEX_FACES, _WEDGE_FACES)}
+
+_ELEMENT_SPECS = {
+    etype: _ElementSpec(DIMENSION_TABLE[etype], 
+                        no_nodes, 
+                        CORNER_NODE_COUNT_TABLE.get(etype, no_nodes), 
+                        _FACE_GETTERS[FACE_INDEX_TABLE[etype]] if etype in FACE_INDEX_TABLE else None)
+    for etype, no_nodes in NODE_COUNT_TABLE.items()
+}
+
+@dataclass(frozen=True, slots=True)
 class Element:
     """Class representing an element"""
     id:int
@@ -106,53 +197,58 @@ class Element:
     """Enum type of this element"""
     node_ids:tuple[int, ...]
     """Node ids belonging to this element"""
-
-    _is_initialized:bool = field(init=False, default=False)
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        super().__setattr__(name, value)
-        self._validate(name)
+    corner_node_count:int = field(init=False, repr=False, compare=False)
+    """Number of corner nodes of this element"""
+    _spec:_ElementSpec = field(init=False, repr=False, compare=False)
+    _faces:tuple[tuple[int, ...], ...]|None = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self):
-        self._is_initialized = True # triggers validation through __setattr__
-
-    def _validate(self, name:str):
-
-        if not self._is_initialized: return
-        if name == 'id':
-            if self.id < 0:
-                raise ValueError(f"id has to be greater than 0, got{self.id}")
-        no_nodes = NODE_COUNT_TABLE[self.type]
-        ename = self.type.name
-        if len(self.node_ids) != no_nodes:   
-            if name == 'node_ids':   
-                raise ValueError(f"Element of type {ename} must have {no_nodes} node ids, got {len(self.node_ids)}")
-            if name == 'type':   
-                raise ValueError(f"An element of type {ename} must have {no_nodes} node ids, this element has {len(self.node_ids)}")
+        if self.id < 0:
+            raise ValueError(f"id has to be greater than 0, got {self.id}")
+        spec = _ELEMENT_SPECS[self.type]
+        no_nodes, got = spec.node_count, len(self.node_ids)
+        if got != no_nodes:   
+            raise ValueError(f"Element of type {self.type.name} must have {no_nodes} node ids, got {got}")
+        object.__setattr__(self, '_spec', spec)
+        object.__setattr__(self, 'corner_node_count', spec.corner_node_count)
 
     def get_dim(self) -> int:
         """Gets the dimension of this Element"""
-        return get_element_dimension(self.type)
+        return self._spec.dim
 
     def get_corner_node_count(self) -> int:
         """Gets the number of corner nodes of this element"""
-        if self.type in CORNER_NODE_COUNT_TABLE:
-            return CORNER_NODE_COUNT_TABLE[self.type]
-        return len(self.node_ids)
+        return self.corner_node_count
 
     def get_corner_node_ids(self) -> tuple[int, ...]:
         """Gets the ids of the corner nodes"""
-        return self.node_ids[:self.get_corner_node_count()]
+        return self.node_ids[:self.corner_node_count]
 
     def get_faces(self) -> tuple[tuple[int, ...]]:
-        """Gets the faces of this element"""
-        face_node_ind = FACE_INDEX_TABLE.get(self.type, [])
-        faces = []
-        for inds in face_node_ind:
-            nids = tuple(self.node_ids[i] for i in inds)
-            faces.append(nids)
-
-        return tuple(faces)
+        """Gets the faces of this element. The faces are computed on the first call."""
+        if self._faces is None:
+            if self._spec.face_getters is None: return ()
+            object.__setattr__(self, '_faces', tuple(self.iter_faces()))
+        return self._faces  # type: ignore
+
+    def get_faces_array(self) -> np.ndarray:
+        """Gets the faces of this element as structured array with FACE_RECORD_DTYPE"""
+        faces = self.get_faces()
+        records = np.empty(len(faces), dtype=FACE_RECORD_DTYPE)
+        records['number'] = np.arange(1, len(faces) + 1)
+        records['element_id'] = self.id
+        records['node_ids'] = -1
+        for rec, nids in zip(records['node_ids'], faces):
+            rec[:len(nids)] = nids
+        return records
+
+    def iter_faces(self) -> Iterator[tuple[int, ...]]:
+        """Iterates over the faces of this element without storing them"""
+        getters = self._spec.face_getters
+        if getters is None: return
+        nids = self.node_ids
+        for getter in getters:
+            yield getter(nids)
 
 
 
@@ -17,13 +17,17 @@ along with pygccx.
 If not, see <http://www.gnu.org/licenses/>.
 '''
 
-from dataclasses import dataclass, field
-from typing import Iterable, Sequence, Optional
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from itertools import chain
+from typing import Any, Iterable, Sequence, Optional, TextIO
+import numpy as np
+import numpy.typing as npt
 
 from pygccx import enums, protocols
-from pygccx.auxiliary import f2s
 from . import surface
-from .element import Element
+from .element import Element, NODE_COUNT_TABLE, FACE_INDEX_TABLE, FACE_RECORD_DTYPE
+from .element import build_face_connectivity
 from .set import Set
 
 
@@ -41,6 +45,10 @@ class Mesh:
     """List with all element sets of this mesh"""
     surfaces:list[protocols.ISurface] = field(default_factory=list)
     """List with all surfaces (node based and element face based) of this mesh"""
+    _node_set_index:'_NameIndex' = field(init=False, default_factory=lambda: _NameIndex(), repr=False, compare=False)
+    _element_set_index:'_NameIndex' = field(init=False, default_factory=lambda: _NameIndex(), repr=False, compare=False)
+    _surface_index:'_NameIndex' = field(init=False, default_factory=lambda: _NameIndex(), repr=False, compare=False)
+    _type_index:'_TypeIndex' = field(init=False, default_factory=lambda: _TypeIndex(), repr=False, compare=False)
 
     def get_nodes_by_ids(self, *ids:int) -> tuple[tuple[float, float, float],...]:
         """
@@ -51,6 +59,26 @@ class Mesh:
         """
         return tuple(self.nodes[nid] for nid in ids)
 
+    def get_node_arrays(self, *ids:int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the ids and the coordinates of nodes as contiguous arrays.
+
+        Args:
+            ids (int): Ids of nodes to be returned. If omitted, all nodes are returned
+                in the order of this mesh.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Node ids as int32 array with shape (n,) and 
+            coordinates as float64 array with shape (n, 3). Row i of the coordinates
+            belongs to node i.
+        """
+        if ids: coords = map(self.nodes.__getitem__, ids)
+        else: ids, coords = self.nodes.keys(), self.nodes.values()  # type: ignore
+        n = len(ids)
+        id_arr = np.fromiter(ids, dtype=np.int32, count=n)
+        coord_arr = np.fromiter(chain.from_iterable(coords), dtype=np.float64, count=3 * n)
+        return id_arr, coord_arr.reshape(n, 3)
+
     def get_elements_by_ids(self, *ids:int) -> tuple[protocols.IElement,...]:
         """
         Gets a tuple of elements for the given ids
@@ -62,7 +90,83 @@ class Mesh:
 
     def get_elements_by_type(self, etype:enums.EEtypes) -> tuple[protocols.IElement,...]:
         """Gets a tuple of elements with the given element type."""      
-        return tuple(e for e in self.elements.values() if e.type == etype)
+        ids = self._type_index.get(self.elements).get(etype, ())
+        return tuple(map(self.elements.__getitem__, ids))
+
+    def get_element_types(self) -> tuple[enums.EEtypes, ...]:
+        """Gets a tuple with all element types used in this mesh in order of their first occurrence."""
+        return tuple(self._type_index.get(self.elements))
+
+    def get_connectivity(self, etype:enums.EEtypes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the element ids and the node ids of all elements with the given
+        element type as contiguous int32 arrays. 
+        CalculiX ids are 4 byte integers, so int32 holds every valid id.
+
+        Args:
+            etype (enums.EEtypes): Element type
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Element ids with shape (n,) and 
+            node ids with shape (n, number of nodes per element). Row i of the 
+            node ids belongs to element i.
+        """
+        elems = self.get_elements_by_type(etype)
+        n, no_nodes = len(elems), NODE_COUNT_TABLE[etype]
+        # fromiter stops silently at count, so wrong node counts are checked beforehand
+        for e in elems:
+            if len(e.node_ids) != no_nodes:
+                raise ValueError(f"Element {e.id} of type {etype.name} must have {no_nodes} node ids, got {len(e.node_ids)}")
+        ids = np.fromiter((e.id for e in elems), dtype=np.int32, count=n)
+        # flat fill of the preallocated array, no nested list per element
+        conn = np.fromiter(chain.from_iterable(e.node_ids for e in elems), dtype=np.int32, count=n * no_nodes)
+        return ids, conn.reshape(n, no_nodes)
+
+    def get_element_faces(self, etype:enums.EEtypes) -> tuple[np.ndarray, tuple[np.ndarray, ...]]:
+        """
+        Gets the faces of all elements with the given element type.
+
+        The faces of all elements are gathered at once from the connectivity 
+        (see get_connectivity and element.build_face_connectivity).
+
+        Args:
+            etype (enums.EEtypes): Element type
+
+        Returns:
+            tuple[np.ndarray, tuple[np.ndarray, ...]]: Element ids with shape (n,) and
+            one node id array per face number. faces[i] has the shape 
+            (n, number of nodes of face i+1) and row j belongs to element j.
+            Element types without faces return an empty tuple of faces.
+        """
+        ids, conn = self.get_connectivity(etype)
+        faces = FACE_INDEX_TABLE.get(etype)
+        if faces is None: return ids, ()
+        face_nids = build_face_connectivity(conn, etype)[0].reshape(len(ids), len(faces), 4)
+        # drop the padding of faces with 3 nodes
+        return ids, tuple(face_nids[:, i, :len(inds)] for i, inds in enumerate(faces))
+
+    def get_face_records(self) -> np.ndarray:
+        """
+        Gets the faces of all elements of this mesh as one structured array
+        with FACE_RECORD_DTYPE (see element.FACE_RECORD_DTYPE).
+
+        The records are grouped by element type. Within a type, the faces
+        of each element follow each other.
+
+        Returns:
+            np.ndarray: Face records with fields number, element_id and node_ids
+        """
+        blocks = []
+        for etype in self.get_element_types():
+            ids, conn = self.get_connectivity(etype)
+            face_nids, numbers, elem_inds = build_face_connectivity(conn, etype)
+            block = np.empty(len(numbers), dtype=FACE_RECORD_DTYPE)
+            block['number'] = numbers
+            block['element_id'] = ids[elem_inds]
+            block['node_ids'] = face_nids
+            blocks.append(block)
+        if not blocks: return np.empty(0, dtype=FACE_RECORD_DTYPE)
+        return np.concatenate(blocks)
 
     def get_set_by_name_and_type(self, set_name:str, set_type:enums.ESetTypes=enums.ESetTypes.NODE) -> protocols.ISet:
         """
@@ -80,10 +184,12 @@ class Mesh:
         """
 
         set_name = set_name.upper()
-        sets = self.node_sets if set_type == enums.ESetTypes.NODE else self.element_sets
-        for s in sets:
-            if s.name == set_name: return s
-        raise ValueError(f'No set with name {set_name} found.')
+        if set_type == enums.ESetTypes.NODE:
+            s = self._node_set_index.find(self.node_sets, set_name)
+        else:
+            s = self._element_set_index.find(self.element_sets, set_name)
+        if s is None: raise ValueError(f'No set with name {set_name} found.')
+        return s
 
     def get_node_set_by_name(self, set_name:str) -> protocols.ISet:
         """
@@ -112,8 +218,8 @@ class Mesh:
     def get_max_node_id(self) -> int:
         """Gets the maximum defined node id"""
 
-        if not self.nodes: return 0
-        return max(self.nodes.keys())
+        # not cached, nodes may be changed directly
+        return max(self.nodes, default=0)
 
     def get_next_node_id(self) -> int:
         """Gets the next highest free node id."""
@@ -122,8 +228,8 @@ class Mesh:
     def get_max_element_id(self) -> int:
         """Gets the maximum defined element id"""
 
-        if not self.elements: return 0
-        return max(self.elements.keys())
+        # not cached, elements may be changed directly
+        return max(self.elements, default=0)
 
     def get_next_element_id(self) -> int :
         """Gets the next highest free element id."""
@@ -167,8 +273,7 @@ class Mesh:
             ValueError: RAISED if dim of node_set is not 2
         """
 
-        surf = surface.get_surface_from_node_set(surf_name, self.elements.values(), 
-                                                node_set, surf_type)
+        surf = self.get_surface_from_node_set(surf_name, node_set, surf_type)
         self.surfaces.append(surf)
         return surf
 
@@ -183,9 +288,9 @@ class Mesh:
             protocols.ISurface: Surface with given name
         """
         surf_name = surf_name.upper()
-        for s in self.surfaces:
-            if s.name.upper()==surf_name: return s
-        raise ValueError(f'No surface with name {surf_name} found.')
+        s = self._surface_index.find(self.surfaces, surf_name)
+        if s is None: raise ValueError(f'No surface with name {surf_name} found.')
+        return s
 
     def add_node(self, coords:Sequence[protocols.number], id:Optional[int]=None, node_set:Optional[protocols.ISet]=None) -> int:
         """
@@ -218,10 +323,15 @@ class Mesh:
         if node_set and node_set.type != enums.ESetTypes.NODE:
             raise ValueError(f"set_type of node_set has to be {enums.ESetTypes.NODE}, got {node_set}.")
 
-        try:
-            self.nodes[id] = tuple(map(float, coords))
-        except:
-            raise ValueError(f"coords has to be a sequence of numeric values.")
+        x, y, z = coords
+        if type(coords) is tuple and type(x) is float and type(y) is float and type(z) is float:
+            node = coords
+        else:
+            try:
+                node = (float(x), float(y), float(z))
+            except (TypeError, ValueError):
+                raise ValueError(f"coords has to be a sequence of numeric values.") from None
+        self.nodes[id] = node
 
         if node_set: node_set.ids.add(id)
 
@@ -259,6 +369,96 @@ class Mesh:
 
         return id
 
+    def add_nodes(self, coords:npt.ArrayLike, ids:Optional[npt.ArrayLike]=None, node_set:Optional[protocols.ISet]=None) -> np.ndarray:
+        """
+        Adds several nodes to this mesh at once.
+
+        Nodes with already existing ids are replaced.
+        If ids is omitted, the next available ids are used.
+
+        Args:
+            coords (npt.ArrayLike): coordinates of the new nodes with shape (n, 3)
+            ids (Optional[npt.ArrayLike], optional): ids of the new nodes with shape (n,). Defaults to None.
+            node_set (Optional[protocols.ISet], optional): Set with type == NODE where the new nodes should be added to. Defaults to None.
+
+        Raises:
+            ValueError: raised if any id is < 1
+            ValueError: raised if coords doesn't have the shape (n, 3)
+            ValueError: raised if ids and coords have different lengths
+            ValueError: raised if set type of node_set is not NODE
+            ValueError: raised if not all coordinates in coords are numeric
+
+        Returns:
+            np.ndarray: The ids of the nodes
+        """
+
+        try:
+            coords = np.asarray(coords, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError(f"coords has to be an array of numeric values.") from None
+        if coords.ndim != 2 or coords.shape[1] != 3:
+            raise ValueError(f"coords has to be of shape (n, 3), got {coords.shape}")
+        ids = self._get_new_ids(ids, len(coords), self.get_next_node_id())
+        if node_set and node_set.type != enums.ESetTypes.NODE:
+            raise ValueError(f"set_type of node_set has to be {enums.ESetTypes.NODE}, got {node_set}.")
+
+        id_list = ids.tolist()
+        self.nodes.update(zip(id_list, map(tuple, coords.tolist())))
+
+        if node_set: node_set.ids.update(id_list)
+
+        return ids
+
+    def add_elements(self, etype:enums.EEtypes, nids:npt.ArrayLike, ids:Optional[npt.ArrayLike]=None, el_set:Optional[protocols.ISet]=None) -> np.ndarray:
+        """
+        Adds several elements of the same type to this mesh at once.
+
+        Elements with already existing ids are replaced.
+        If ids is omitted, the next available ids are used.
+
+        Args:
+            etype (enums.EEtypes): Type of the new elements
+            nids (npt.ArrayLike): node ids of the new elements with shape (n, number of nodes per element)
+            ids (Optional[npt.ArrayLike], optional): Ids of the new elements with shape (n,). Defaults to None.
+            el_set (Optional[protocols.ISet], optional): Set with type == ELEMENT where the new elements should be added to. Defaults to None.
+
+        Raises:
+            ValueError: Raised if any id is < 1
+            ValueError: Raised if nids doesn't have the shape (n, number of nodes per element)
+            ValueError: Raised if ids and nids have different lengths
+            ValueError: Raised if type of set is not ELEMENT
+
+        Returns:
+            np.ndarray: The ids of the elements
+        """
+
+        nids = np.asarray(nids, dtype=np.int64)
+        no_nodes = NODE_COUNT_TABLE[etype]
+        if nids.ndim != 2 or nids.shape[1] != no_nodes:
+            raise ValueError(f"nids of elements of type {etype.name} has to be of shape (n, {no_nodes}), got {nids.shape}")
+        ids = self._get_new_ids(ids, len(nids), self.get_next_element_id())
+        if el_set and el_set.type != enums.ESetTypes.ELEMENT:
+            raise ValueError(f"set_type of element_set has to be {enums.ESetTypes.ELEMENT}, got {el_set}.")
+
+        id_list = ids.tolist()
+        elems = [Element(id, etype, tuple(e_nids)) for id, e_nids in zip(id_list, nids.tolist())]
+        self.elements.update(zip(id_list, elems))
+
+        if el_set: el_set.ids.update(id_list)
+
+        return ids
+
+    @staticmethod
+    def _get_new_ids(ids:Optional[npt.ArrayLike], n:int, next_id:int) -> np.ndarray:
+        # ids for n new nodes or elements. Consecutive ids starting at next_id if ids is None
+        if ids is None: return np.arange(next_id, next_id + n)
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.shape != (n,):
+            raise ValueError(f"ids has to be of shape ({n},), got {ids.shape}")
+        if n and ids.min() <= 0:
+            raise ValueError(f"ids have to be greater than 0, got {ids.min()}")
+        return ids
+
     def add_set(self, set_name:str, set_type:enums.ESetTypes, ids:Iterable[int]) -> protocols.ISet:
         """
         Creates and adds a new set to the mesh and returns it.
@@ -275,11 +475,8 @@ class Mesh:
             ISet: The new set
         """
 
-        new_set = Set(set_name.upper(), set_type, set(ids))
-        self.add_sets(new_set)
-        if set_type==enums.ESetTypes.NODE: 
-            return self.get_node_set_by_name(set_name)
-        return self.get_el_set_by_name(set_name)
+        # the ids are always copied, so the new set never shares them with the caller
+        return self._merge_or_add_set(Set(set_name.upper(), set_type, set(ids)))
 
     def add_sets(self, *sets:protocols.ISet):
         """
@@ -289,21 +486,22 @@ class Mesh:
         will be added to the existing set
         """
 
-        for s in sets:
-            if s.type==enums.ESetTypes.NODE:
-                try: existing_set = self.get_node_set_by_name(s.name)
-                except: existing_set = None
-                if existing_set: 
-                    print(f'Node set "{s.name}" already exists. Ids are added to existing.')
-                    existing_set.ids.update(s.ids)
-                else: self.node_sets.append(s)
-            else:
-                try: existing_set = self.get_el_set_by_name(s.name)
-                except: existing_set = None
-                if existing_set: 
-                    print(f'Element set "{s.name}" already exists. Ids are added to existing.')
-                    existing_set.ids.update(s.ids)
-                else: self.element_sets.append(s)
+        for s in sets: self._merge_or_add_set(s)
+
+    def _merge_or_add_set(self, s:protocols.ISet) -> protocols.ISet:
+        # adds s to this mesh or its ids to an existing set with the same name and type.
+        # returns the set which is part of the mesh afterwards.
+        if s.type==enums.ESetTypes.NODE:
+            kind, items, index = 'Node', self.node_sets, self._node_set_index
+        else:
+            kind, items, index = 'Element', self.element_sets, self._element_set_index
+        existing_set = index.find(items, s.name.upper())
+        if existing_set is None:
+            index.append(items, s)
+            return s
+        print(f'{kind} set "{s.name}" already exists. Ids are added to existing.')
+        existing_set.ids.update(s.ids)
+        return existing_set
 
     def add_node_surface(self, surf_name:str, nids:Iterable[int]) -> protocols.ISurface:
         """
@@ -353,8 +551,7 @@ class Mesh:
         will be added to the existing surface
         """
         for s in surfaces:
-            try: existing = self.get_surface_by_name(s.name.upper())
-            except: existing = None
+            existing = self._surface_index.find(self.surfaces, s.name.upper())
             if existing:
                 if not type(s) is type(existing):
                     raise ValueError(f'A surface with name {s.name} already exists, but of type {existing.type.name}. ' +
@@ -367,8 +564,7 @@ class Mesh:
                     print(f'Element face surface "{s.name}" already exists. Content is added to existing.')
                     existing.element_faces.update(s.element_faces)
             else:
-                self.surfaces.append(s)
-                
+                self._surface_index.append(self.surfaces, s)
 
     def change_element_type(self, etype:enums.EEtypes, *ids:int):
         """
@@ -386,7 +582,7 @@ class Mesh:
         """
 
         for id in ids:
-            self.elements[id].type = etype
+            self.elements[id] = replace(self.elements[id], type=etype)
 
     def write_ccx(self, buffer:list[str]):
         """Writes the CCX input string to the given buffer."""
@@ -396,45 +592,130 @@ class Mesh:
         self._write_sets_ccx(buffer)
         self._write_surfaces_ccx(buffer)
 
+    def write_ccx_file(self, file:TextIO):
+        """
+        Writes the CCX input string to the given text file.
+
+        The input is written section by section (nodes, elements, sets, surfaces),
+        so only the lines of one section are held in memory at a time.
+        """
+
+        for write_section in (self._write_nodes_ccx, self._write_elements_ccx, 
+                              self._write_sets_ccx, self._write_surfaces_ccx):
+            buffer = []
+            write_section(buffer)
+            if buffer: file.write('\n'.join(buffer) + '\n')
+
     def _write_nodes_ccx(self, buffer:list[str]):
         if not self.nodes: return
-        buffer += ['*NODE']
-        for nid, coords in self.nodes.items():
-            buffer += [f'{nid},' + ','.join(map(f2s, coords))]
-            # buffer += ['{},{:15.7e},{:15.7e},{:15.7e}'.format(nid, *coords)]
+        buffer.append('*NODE')
+        # one printf style format per node, same output as f2s for each coordinate
+        buffer.extend(['%d,%.7e,%.7e,%.7e' % (nid, x, y, z) for nid, (x, y, z) in self.nodes.items()])
 
     def _write_elements_ccx(self, buffer:list[str]):
         if not self.elements:return
-        EEtypes = {e.type for e in self.elements.values()}
-        for etype in EEtypes:
-            elems = (e for e in self.elements.values() if e.type==etype)
-            buffer += [f'*ELEMENT,TYPE={etype.name}']
-            for e in elems:
-                lst = (e.id,) + e.node_ids
-                _write_as_chunks(buffer, lst, 16)
+        buckets = defaultdict(list)
+        for e in self.elements.values(): buckets[e.type].append(e)
+        for etype, elems in buckets.items():
+            buffer.append(f'*ELEMENT,TYPE={etype.name}')
+            fmt = _ELEMENT_FORMATS[etype]
+            lines = [fmt % (e.id, *e.node_ids) for e in elems]
+            # elements with more than 15 nodes span several lines
+            if '\n' in fmt: lines = '\n'.join(lines).split('\n')
+            buffer.extend(lines)
 
     def _write_sets_ccx(self, buffer:list[str]):
         for s in self.node_sets:
             if s.ids:
-                buffer += [f'*NSET,NSET={s.name}']
+                buffer.append(f'*NSET,NSET={s.name}')
                 _write_as_chunks(buffer, tuple(s.ids), 16)
         for s in self.element_sets:
             if s.ids:
-                buffer += [f'*ELSET,ELSET={s.name}']
+                buffer.append(f'*ELSET,ELSET={s.name}')
                 _write_as_chunks(buffer, tuple(s.ids), 16)
 
     def _write_surfaces_ccx(self, buffer:list[str]):
         for f in self.surfaces:
             f.write_ccx(buffer)
 
-def _write_as_chunks(buffer:list[str], seq:Sequence, n:int):
-    lines = _list_to_chunks(seq, n)
-    for i, line in enumerate(lines):
-        if i == len(lines) - 1: 
-            buffer.append(','.join(map(str, line)))
-        else:
-            buffer.append(','.join(map(str, line)) + ',')
+def _chunked_format(no_values:int, n:int) -> str:
+    # printf style format of no_values integers with n values per line, 
+    # same layout as _write_as_chunks
+    lines = [','.join(['%d'] * min(n, no_values - i)) for i in range(0, no_values, n)]
+    return ',\n'.join(lines)
+
+# format of the id and node ids of one element per element type
+_ELEMENT_FORMATS = {etype: _chunked_format(no_nodes + 1, 16) for etype, no_nodes in NODE_COUNT_TABLE.items()}
+
+class _NameIndex:
+    # Index of the items (sets or surfaces) of one public list of Mesh by their 
+    # upper case name. Sets and surfaces are frozen, so their names don't change.
+    # The list may be changed directly, so
+    # - a hit is only used if the item is still at its indexed position
+    # - a miss is only trusted if the list still holds the indexed items. This is
+    #   checked with a list comparison, which compares by identity first at C level.
+    # Otherwise the index is rebuilt.
+
+    def __init__(self):
+        self._items:list = []
+        self._index:dict[str, tuple[int, Any]] = {}
+
+    def find(self, items:list, name:str):
+        """Gets the first item with the given upper case name from items or None"""
+        hit = self._index.get(name)
+        if hit is not None:
+            pos, item = hit
+            if pos < len(items) and items[pos] is item: return item
+        elif items == self._items:
+            return None
+        self._rebuild(items)
+        hit = self._index.get(name)
+        return None if hit is None else hit[1]
+
+    def append(self, items:list, item):
+        """
+        Appends item to items and adds it to the index. 
+        find must have returned None for the name of item right before.
+        """
+        items.append(item)
+        self._items.append(item)
+        self._index.setdefault(item.name.upper(), (len(items) - 1, item))
+
+    def _rebuild(self, items:list):
+        self._items = list(items)
+        self._index = {}
+        for pos, item in enumerate(items):
+            self._index.setdefault(item.name.upper(), (pos, item))
+
+class _TypeIndex:
+    # Element ids by element type in order of the elements dict. Mesh.elements may
+    # be changed directly, so the index is only used if the dict still holds the
+    # same ids and elements in the same order as when it was built. Elements are 
+    # frozen, so equal elements have equal types. The list comparisons run at 
+    # C level and compare by identity first.
+
+    def __init__(self):
+        self._ids:list[int] = []
+        self._elements:list = []
+        self._index:dict[enums.EEtypes, list[int]] = {}
+
+    def get(self, elements:dict) -> dict[enums.EEtypes, list[int]]:
+        """Gets the element ids by type for elements in order of first occurrence"""
+        ids, elems = list(elements), list(elements.values())
+        if ids != self._ids or elems != self._elements:
+            self._ids, self._elements = ids, elems
+            self._index = {}
+            for id, e in zip(ids, elems):
+                type_ids = self._index.get(e.type)
+                if type_ids is None: self._index[e.type] = [id]
+                else: type_ids.append(id)
+        return self._index
 
-def _list_to_chunks(lst:Sequence, n:int):
+def _write_as_chunks(buffer:list[str], seq:Sequence, n:int):
+    # every line but the last ends with a comma.
+    # chunks are sliced from seq while writing, so no list of all chunks is built
+    if not seq: return
     n = max(1, n)
-    return [lst[i:i+n] for i in range(0, len(lst) or 1, n)]
\ No newline at end of file
+    last = (len(seq) - 1) // n * n  # start of the last chunk
+    buffer.extend([','.join(map(str, seq[i:i+n])) + ',' for i in range(0, last, n)])
+    buffer.append(','.join(map(str, seq[last:])))
\ No newline at end of file
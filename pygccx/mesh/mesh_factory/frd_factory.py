@@ -3,6 +3,7 @@ from typing import Optional
 from pygccx.enums import EEtypes
 from pygccx.exceptions import ElementTypeNotSupportedError
 from .. import Mesh, Element
+from ..element import NODE_COUNT_TABLE
 from . inp_factory import _clear_mesh
 
 FRD_2_CCX_ETYPE_MAP = {  
@@ -82,23 +83,22 @@ def mesh_from_frd(filename:str, type_mapping:Optional[dict[int, EEtypes]]=None,
 
 def _read_node_block(line:str, f) -> tuple[dict[int, tuple[float,...]], str]:
 
-    nodes = {}
+    # collect the node lines of the block first and parse them afterwards,
+    # so the fixed width fields are converted in tight comprehensions
+    block = []
     for line in f:
-        line_split = line.split()
-        key = line_split[0] 
-        if key == '-3': break
-
-        n_id=int(line[3:13])
-        n_x=float(line[13:25])
-        n_y=float(line[25:37])
-        n_z=float(line[37:])
-        nodes[n_id] = (n_x, n_y, n_z)
+        if line.lstrip().startswith('-3'): break
+        block.append(line)
 
-    return nodes, line
+    n_ids = [int(l[3:13]) for l in block]
+    coords = [(float(l[13:25]), float(l[25:37]), float(l[37:])) for l in block]
+    return dict(zip(n_ids, coords)), line
 
 def _read_element_block(line:str, f, type_mapping:dict, skip_unsup_elems:bool):
 
     elems = {}
+    e_id, etype, no_nodes = 0, EEtypes.C3D4, 0
+    nids, skip = [], False
     for line in f:
         line_split = line.split()
         key = line_split[0]    
@@ -106,6 +106,7 @@ def _read_element_block(line:str, f, type_mapping:dict, skip_unsup_elems:bool):
             break
        
         if key == '-1':
+            _check_element_complete(nids, e_id, etype)
             e_id = int(line_split[1])
             e_type = int(line_split[2])
             skip = False
@@ -116,17 +117,27 @@ def _read_element_block(line:str, f, type_mapping:dict, skip_unsup_elems:bool):
                 raise ElementTypeNotSupportedError(
                     f'{e_type} is not a supported frd element type number.'
                 )
+            etype = type_mapping[e_type]
+            no_nodes = NODE_COUNT_TABLE[etype]
             nids = []
 
         if key == '-2' and not skip:
-            for nId in line_split[1:]:
-                nId = int(nId)
-                nids.append(nId)
-
-            elems[e_id] = Element(e_id, type_mapping[e_type], tuple(nids))
-
+            # node ids of elements with more than 10 nodes span several -2 lines.
+            # The element is built as soon as all of them are read.
+            nids.extend(map(int, line_split[1:]))
+            if len(nids) >= no_nodes:
+                elems[e_id] = Element(e_id, etype, tuple(nids))
+                nids = []
+
+    _check_element_complete(nids, e_id, etype)
     return elems, line
 
+def _check_element_complete(nids:list[int], e_id:int, etype:EEtypes):
+    # raises if the -2 lines of the last element ended before all node ids were read
+    if nids:
+        raise ValueError(f"Element {e_id} of type {etype.name} must have "
+                         f"{NODE_COUNT_TABLE[etype]} node ids, got {len(nids)}")
+
 def _check_type_mapping(type_mapping:dict[int, EEtypes]):
 
     for gt, ccxt in type_mapping.items():
@@ -18,6 +18,7 @@ If not, see <http://www.gnu.org/licenses/>.
 '''
 
 from typing import TYPE_CHECKING, Optional
+import numpy as np
 from .. import Mesh, Element, Set
 from pygccx.enums import EEtypes, ESetTypes
 from pygccx.protocols import IElement, ISet
@@ -59,6 +60,9 @@ GMSH_2_CCX_NODE_MAP = {
     18: (0,1,2,3,4,5,6,9,7,12,14,13, 8,10,11)
 }
 
+# GMSH_2_CCX_NODE_MAP as intp index arrays for reordering whole element blocks
+_GMSH_2_CCX_NODE_INDICES = {et: np.asarray(inds, dtype=np.intp) for et, inds in GMSH_2_CCX_NODE_MAP.items()}
+
 def mesh_from_gmsh(gmsh:'_gmsh', type_mapping:Optional[dict[int, EEtypes]]=None, skip_unsup_elems:bool=False) -> Mesh:  # type: ignore
     """
     Builds a pygccx mesh object from the given gmsh api and returns it
@@ -73,36 +77,42 @@ def mesh_from_gmsh(gmsh:'_gmsh', type_mapping:Optional[dict[int, EEtypes]]=None,
         Mesh: The converted mesh
     """
     nodes = _get_nodes_from_gmsh(gmsh)
-    elems = _get_elements_from_gmsh(gmsh, type_mapping, skip_unsup_elems)
-    node_sets, element_sets = _get_physical_groups_from_gmsh(gmsh)
+    # the volume elements are fetched once and used for the elements and the element sets
+    entity_elems = _get_entity_elements_from_gmsh(gmsh)
+    elems = _get_elements_from_gmsh(entity_elems, type_mapping, skip_unsup_elems)
+    node_sets, element_sets = _get_physical_groups_from_gmsh(gmsh, entity_elems)
     return Mesh(nodes, elems, node_sets, element_sets) 
 
 def _get_nodes_from_gmsh(gmsh:'_gmsh') -> dict[int, tuple[float, float, float]]:  # type: ignore
 
     nids, ncoords, _ = gmsh.model.mesh.get_nodes()
-    return {int(nid): tuple(coords) for nid, coords in zip(nids, ncoords.reshape((-1,3)))}  # type: ignore
+    # tolist converts the whole arrays at once to python ints and floats
+    return dict(zip(nids.tolist(), map(tuple, ncoords.reshape((-1,3)).tolist())))  # type: ignore
+
+def _get_entity_elements_from_gmsh(gmsh:'_gmsh') -> dict[int, tuple]:  # type: ignore
+    # (element types, element ids, node ids) of each volume entity as returned by getElements
+    return {tag: gmsh.model.mesh.getElements(dim, tag) for dim, tag in gmsh.model.getEntities(3)}
 
-def _get_elements_from_gmsh(gmsh:'_gmsh', type_mapping:Optional[dict[int, EEtypes]]|None, ignore:bool) -> dict[int, IElement]:  # type: ignore
+def _get_elements_from_gmsh(entity_elems:dict[int, tuple], type_mapping:Optional[dict[int, EEtypes]]|None, ignore:bool) -> dict[int, IElement]:
 
-    etype_map = GMSH_2_CCX_ETYPE_MAP.copy()
+    etype_map = GMSH_2_CCX_ETYPE_MAP
     if type_mapping:
         _check_type_mapping(type_mapping) 
-        etype_map.update(type_mapping)
+        etype_map = {**GMSH_2_CCX_ETYPE_MAP, **type_mapping}
 
     elems = {}
-    EEtypes, eids, nids = gmsh.model.mesh.getElements(3)
-    for et, et_eids, et_nids in zip(EEtypes, eids, nids):
+    blocks = (b for etypes, eids, nids in entity_elems.values() for b in zip(etypes, eids, nids))
+    for et, et_eids, et_nids in blocks:
         if et not in etype_map:
             if ignore: continue
             raise ElementTypeNotSupportedError(
                 f'{et} is not a supported gmsh element type number.'
             )
-        et_nids = et_nids.reshape((len(et_eids), -1))  # type: ignore
-        for e_id, e_nids in zip(et_eids, et_nids):
-            elems[int(e_id)] = Element(
-                int(e_id), 
-                etype_map[et], 
-                _reorder_nodes_from_gmsh_2_ccx(et, e_nids))
+        et_nids = _reorder_nodes_from_gmsh_2_ccx(et, et_nids.reshape((len(et_eids), -1)))  # type: ignore
+        ccx_etype = etype_map[et]
+        # whole blocks are converted to python ints at once instead of per element
+        for e_id, e_nids in zip(et_eids.tolist(), et_nids.tolist()):
+            elems[e_id] = Element(e_id, ccx_etype, tuple(e_nids))
     return elems
 
 def _check_type_mapping(type_mapping:dict[int, EEtypes]):
@@ -116,26 +126,34 @@ def _check_type_mapping(type_mapping:dict[int, EEtypes]):
             allowed_str = ','.join([x.name for x in allowed_types])
             raise ValueError(f'gmsh type {gt} can not be mapped to {ccxt.name}. Only {allowed_str} are allowed')
 
-def _reorder_nodes_from_gmsh_2_ccx(gmsh_etype:int, nids) -> tuple[int, ...]:
-    ccx_indices = GMSH_2_CCX_NODE_MAP.get(gmsh_etype)
-    if not ccx_indices: return tuple(nids)
-    return tuple(nids[i] for i in ccx_indices)
+def _reorder_nodes_from_gmsh_2_ccx(gmsh_etype:int, nids:np.ndarray) -> np.ndarray:
+    # reorders the node ids of all elements of one type at once.
+    # nids has the shape (number of elements, number of nodes per element)
+    ccx_indices = _GMSH_2_CCX_NODE_INDICES.get(gmsh_etype)
+    if ccx_indices is None: return nids
+    return nids[:, ccx_indices]
 
-def _get_physical_groups_from_gmsh(gmsh:'_gmsh') -> tuple[list[ISet], list[ISet]]:  # type: ignore
+def _get_physical_groups_from_gmsh(gmsh:'_gmsh', entity_elems:dict[int, tuple]) -> tuple[list[ISet], list[ISet]]:  # type: ignore
 
     node_sets, element_sets = [], []
+    # element ids per volume entity, converted once even if the entity 
+    # belongs to several physical groups
+    entity_eids:dict[int, list[int]] = {}
     for dim, tag in gmsh.model.getPhysicalGroups():
         pg_name = gmsh.model.getPhysicalName(dim, tag)
         nids, _ = gmsh.model.mesh.getNodesForPhysicalGroup(dim, tag)
         node_sets.append(Set(name=pg_name.upper(), 
                         type=ESetTypes.NODE, 
-                        ids=set(nids)))
+                        ids=set(nids.tolist())))
         
         if dim == 3: 
             element_ids = set()
             for geo_id in gmsh.model.getEntitiesForPhysicalGroup(dim, tag):
-                _ , et_eids, _ = gmsh.model.mesh.getElements(dim, geo_id)
-                for eids in et_eids: element_ids.update(eids)
+                eids = entity_eids.get(int(geo_id))
+                if eids is None:
+                    _ , et_eids, _ = entity_elems[int(geo_id)]
+                    eids = entity_eids[int(geo_id)] = [eid for et in et_eids for eid in et.tolist()]
+                element_ids.update(eids)
 
             element_sets.append(Set(name=pg_name.upper(), 
                                 type=ESetTypes.ELEMENT, 
@@ -72,9 +72,11 @@ def surfaces_from_inp(filename:str) -> list[ISurface]:
     mesh = _parse_content(filename, True, read_surfs=True)
     return mesh.surfaces
 
-def _read_and_expand_inp(filename:str) -> list[list[str]]:
+def _read_and_expand_inp(filename:str) -> Iterator[list[str]]:
+    # yields the lines of the file split at commas, lines of included files
+    # are yielded in place of the *INCLUDE line.
+    # lines are streamed, so the whole deck never has to be held in memory.
 
-    out = []
     with open(filename) as f:
         csv_reader = csv.reader(f, delimiter=',')
 
@@ -83,10 +85,9 @@ def _read_and_expand_inp(filename:str) -> list[list[str]]:
             line = line if line[-1] else line[:-1] # delete empty last element
             if line[0] == '*INCLUDE':
                 input = line[1].split('=')[-1]
-                out += _read_and_expand_inp(input)
+                yield from _read_and_expand_inp(input)
             else:
-                out.append(line)
-    return out
+                yield line
 
 def _parse_content(filename:str, ignore:bool=False, **options):
 
@@ -96,7 +97,7 @@ def _parse_content(filename:str, ignore:bool=False, **options):
     read_elsets = options.get('read_elsets', False)
     read_surfs = options.get('read_surfs', False)
 
-    lines = iter(_read_and_expand_inp(filename))
+    lines = _read_and_expand_inp(filename)
     nodes = {}
     elems = {}
     nsets:dict[str, ISet] = {}
@@ -106,9 +107,11 @@ def _parse_content(filename:str, ignore:bool=False, **options):
     line = next(lines, None)
     while line:
 
-        key = line[0].upper()
+        key = line[0]
 
+        # most lines are data lines, only keyword lines need upper()
         if key.startswith('*'):
+            key = key.upper()
             if key == '*NODE' and read_nodes:
                 n, s, line = _read_node_block(line, lines)
                 nodes.update(n)
@@ -148,11 +151,15 @@ def _parse_content(filename:str, ignore:bool=False, **options):
 
 def _get_param_value(line:list[str], param_name:str) -> str|None:
 
-    val = None
+    param_name = param_name.upper()
     for c in line:
-        if c.upper().startswith(param_name.upper()):
+        if c.upper().startswith(param_name):
             return c.split('=')[-1]
 
+def _has_option(line:list[str], option:str) -> bool:
+    # checks the tokens one by one instead of joining and uppercasing the whole line
+    return any(option in c.upper() for c in line)
+
 def _read_node_block(line:list[str], lines:Iterator[list[str]]) -> tuple[dict, ISet|None, list[str]]:
 
     set_name = _get_param_value(line, 'NSET')
@@ -161,9 +168,7 @@ def _read_node_block(line:list[str], lines:Iterator[list[str]]) -> tuple[dict, I
     for line in lines:
         if line[0].startswith('*'): break
 
-        id = int(line[0])
-        coords = tuple(float(c) for c in line[1:])
-        nodes[id] = coords
+        nodes[int(line[0])] = tuple(map(float, line[1:]))
 
     nset = None
     if set_name:
@@ -183,14 +188,16 @@ def _read_element_block(line:list[str], lines:Iterator[list[str]], ignore:bool)
 
     etype = EEtypes[etype.upper()] # type: ignore
       
+    # elements with more than 15 nodes continue on the next line
+    two_lines = NODE_COUNT_TABLE[etype] > 15
     elems = {}
     for line in lines:
         if line[0].startswith('*'): break
 
         eid = int(line[0])
-        nids = tuple(int(c) for c in line[1:])
-        if NODE_COUNT_TABLE[etype] > 15:
-            nids += tuple(int(c) for c in next(lines))
+        nids = tuple(map(int, line[1:]))
+        if two_lines:
+            nids += tuple(map(int, next(lines)))
         elems[eid] = Element(eid, etype, nids)
 
     elset = None
@@ -202,35 +209,37 @@ def _read_element_block(line:list[str], lines:Iterator[list[str]], ignore:bool)
 def _read_nset_block(line:list[str], lines:Iterator[list[str]]) -> tuple[ISet, list[str]]:
 
     set_name = _get_param_value(line, 'NSET')   
-    generate = 'GENERATE' in ','.join(line).upper()
+    generate = _has_option(line, 'GENERATE')
 
     if generate:
         line = next(lines)
         start, stop, inc = [int(c) for c in line]
-        nids = range(start, stop+1, inc)
-        return Set(set_name.upper(), ESetTypes.NODE, 0, set(nids)), line  # type: ignore
+        nids = set(range(start, stop+1, inc))
+        return Set(set_name.upper(), ESetTypes.NODE, nids), line  # type: ignore
 
-    nids = []
+    # ids are added to the set directly, without an intermediate list
+    nids = set[int]()
     for line in lines:
         if line[0].startswith('*'): break
-        nids += [int(c) for c in line if c]
-    return Set(set_name.upper(), ESetTypes.NODE, set(nids)), line  # type: ignore
+        nids.update(map(int, filter(None, line)))
+    return Set(set_name.upper(), ESetTypes.NODE, nids), line  # type: ignore
 
 def _read_elset_block(line:list[str], lines:Iterator[list[str]]) -> tuple[ISet, list[str]]:
     set_name = _get_param_value(line, 'ELSET')   
-    generate = 'GENERATE' in ','.join(line).upper()
+    generate = _has_option(line, 'GENERATE')
 
     if generate:
         line = next(lines)
         start, stop, inc = [int(c) for c in line]
-        eids = range(start, stop+1, inc)
-        return Set(set_name.upper(), ESetTypes.ELEMENT, 0, set(eids)), line  # type: ignore
+        eids = set(range(start, stop+1, inc))
+        return Set(set_name.upper(), ESetTypes.ELEMENT, eids), line  # type: ignore
 
-    eids = []
+    # ids are added to the set directly, without an intermediate list
+    eids = set[int]()
     for line in lines:
         if line[0].startswith('*'): break
-        eids += [int(c) for c in line if c]
-    return Set(set_name.upper(), ESetTypes.ELEMENT, set(eids)), line  # type: ignore
+        eids.update(map(int, filter(None, line)))
+    return Set(set_name.upper(), ESetTypes.ELEMENT, eids), line  # type: ignore
 
 def _read_surface_block(line:list[str], lines:Iterator[list[str]]) -> tuple[ISurface, list[str]]:
 
@@ -266,7 +275,7 @@ def _check_etype(etype:str|None, ignore:bool) -> bool:
             f'Element with type {etype} is not supported!'
         )
 
-    if not etype.upper() in {e.name for e in EEtypes}:
+    if not etype.upper() in EEtypes.__members__:
         if ignore: return False
         raise ElementTypeNotSupportedError(
             f'Element with type {etype} is not supported!'
@@ -294,8 +303,7 @@ def _clear_mesh(mesh:Mesh) -> Mesh:
     node_set_names = {s.name for s in mesh.node_sets}
     for s in mesh.surfaces:
         if isinstance(s, ElementSurface): 
-            faces = {f for f in s.element_faces if f[0] in mesh.elements}
-            s.element_faces.intersection_update(faces)
+            s.element_faces.difference_update([f for f in s.element_faces if f[0] not in mesh.elements])
         elif isinstance(s, NodeSurface):
             s.node_ids.intersection_update(used_nodes)
             s.node_set_names.intersection_update(node_set_names)
@@ -19,9 +19,19 @@ If not, see <http://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass, field
 from typing import Iterable
+import numpy as np
 
 from pygccx import enums, protocols
+from .element import CORNER_NODE_COUNT_TABLE, build_face_connectivity
 
+class _FaceLabels(dict):
+    # ',S<face number>' suffixes of the element face labels written to ccx.
+    # Labels are built once per face number and reused for every face.
+    def __missing__(self, fno:int) -> str:
+        label = self[fno] = f',S{fno}'
+        return label
+
+_FACE_LABELS = _FaceLabels()
 
 @dataclass(frozen=True, slots=True)
 class ElementSurface():
@@ -43,10 +53,9 @@ class ElementSurface():
     def write_ccx(self, buffer:list[str]): 
         """Writes the CCX input string to the given buffer."""
 
-        buffer += [f'*SURFACE,NAME={self.name.upper()},TYPE={self.type.value}']
-        for f in self.element_faces:
-            buffer += [f'{f[0]},S{f[1]}']
-        # buffer[-1] = buffer[-1][:-1] # delete last ','
+        buffer.append(f'*SURFACE,NAME={self.name.upper()},TYPE={self.type.value}')
+        labels = _FACE_LABELS
+        buffer.extend([f'{eid}{labels[fno]}' for eid, fno in self.element_faces])
 
 @dataclass(frozen=True, slots=True)
 class NodeSurface():
@@ -65,10 +74,10 @@ class NodeSurface():
     '''Set with node set names belonging to this surface'''
 
     def write_ccx(self, buffer:list[str]): 
-        buffer += [f'*SURFACE,NAME={self.name.upper()},TYPE={self.type.value}']
-        for x in self.node_set_names | self.node_ids:
-            buffer += [f'{x},']
-        buffer[-1] = buffer[-1][:-1] # delete last ','
+        buffer.append(f'*SURFACE,NAME={self.name.upper()},TYPE={self.type.value}')
+        lines = [f'{x},' for x in self.node_set_names | self.node_ids]
+        if lines: lines[-1] = lines[-1][:-1] # delete last ','
+        buffer.extend(lines)
 
 def get_surface_from_node_set(name:str,
                          elements:Iterable[protocols.IElement], 
@@ -98,17 +107,54 @@ def get_surface_from_node_set(name:str,
         return _get_element_surface_from_set(name, elements, node_set)
 
 
+def get_element_faces_in_node_set(ids:np.ndarray, conn:np.ndarray, 
+                                  etype:enums.EEtypes, 
+                                  node_ids:Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets all faces of n elements with the same type whose nodes are all in node_ids.
+
+    Array based counterpart of the element face search of get_surface_from_node_set.
+    Membership is tested with a boolean lookup table indexed by node id.
+
+    Args:
+        ids (np.ndarray): Element ids with shape (n,). I.e. from Mesh.get_connectivity
+        conn (np.ndarray): Node ids of the elements with shape (n, number of nodes per element)
+        etype (enums.EEtypes): Element type of all elements in conn
+        node_ids (Iterable[int]): Node ids the faces have to consist of
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Element ids and face numbers of the found faces.
+            Element types without faces return empty arrays.
+    """
+    ids, conn = np.asarray(ids), np.asarray(conn)
+    node_ids = np.fromiter(node_ids, dtype=np.int64)
+    if not len(conn) or not len(node_ids): 
+        return ids[:0], np.empty(0, dtype=np.int32)
+    
+    max_id = int(conn.max())
+    in_set = np.zeros(max_id + 1, dtype=bool)
+    in_set[node_ids[(node_ids >= 0) & (node_ids <= max_id)]] = True
+    # only elements with at least one corner node in node_ids can have a face in it
+    touched = in_set[conn[:, :CORNER_NODE_COUNT_TABLE[etype]]].any(axis=1)
+    ids, conn = ids[touched], conn[touched]
+    face_nids, numbers, elem_inds = build_face_connectivity(conn, etype)
+    # padded node ids (-1) always count as in the set
+    mask = np.all(in_set[face_nids] | (face_nids < 0), axis=1)
+    return ids[elem_inds[mask]], numbers[mask]
+
 def _get_element_surface_from_set(name:str, 
                                   elements:Iterable[protocols.IElement], 
                                   node_set:protocols.ISet) -> ElementSurface:
 
     surface:set[tuple[int, int]] = set()
+    # bound methods of the id set, resolved once instead of per element and face
+    isdisjoint, issuperset = node_set.ids.isdisjoint, node_set.ids.issuperset
     for e in elements:
-        if node_set.ids.isdisjoint(e.get_corner_node_ids()): continue
+        if isdisjoint(e.get_corner_node_ids()): continue
         e_faces = e.get_faces()
         if not e_faces: continue
         for f_no, f in enumerate(e_faces, 1):
-            if node_set.ids.issuperset(f):
+            if issuperset(f):
                 surface.add((e.id, f_no))
     return ElementSurface(name.upper(), surface)
 
@@ -0,0 +1,128 @@
+'''
+Copyright Matthias Sedlmaier 2022
+This file is part of pygccx.
+
+pygccx is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as 
+published by the Free Software Foundation, either version 3 of the 
+License, or (at your option) any later version.
+
+pygccx is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty 
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with pygccx.  
+If not, see <http://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from dataclasses import FrozenInstanceError
+from pygccx.mesh import Element
+from pygccx.mesh.element import get_element_dimension, NODE_COUNT_TABLE, FACE_INDEX_TABLE
+from pygccx.mesh.element import build_face_connectivity
+import numpy as np
+from pygccx.enums import EEtypes
+
+class TestElement(unittest.TestCase):
+
+    def test_tables_read_only(self):
+        with self.assertRaises(TypeError):
+            NODE_COUNT_TABLE[EEtypes.C3D4] = 5  # type: ignore
+        with self.assertRaises(TypeError):
+            del FACE_INDEX_TABLE[EEtypes.C3D4]  # type: ignore
+
+    def test_face_tables_shared(self):
+        self.assertIs(FACE_INDEX_TABLE[EEtypes.C3D4], FACE_INDEX_TABLE[EEtypes.C3D10])
+        self.assertIs(FACE_INDEX_TABLE[EEtypes.C3D8I], FACE_INDEX_TABLE[EEtypes.C3D20R])
+        self.assertIs(FACE_INDEX_TABLE[EEtypes.C3D6], FACE_INDEX_TABLE[EEtypes.C3D15])
+
+    def test_get_element_dimension(self):
+        self.assertEqual(get_element_dimension(EEtypes.MASS), 0)
+        self.assertEqual(get_element_dimension(EEtypes.SPRINGA), 1)
+        self.assertEqual(get_element_dimension(EEtypes.C3D15), 3)
+        for etype in EEtypes:
+            self.assertIn(get_element_dimension(etype), (0, 1, 2, 3))
+        self.assertRaises(ValueError, get_element_dimension, 'S4')
+
+    def test_init(self):
+        e = Element(1, EEtypes.C3D4, (1,2,3,4))
+        self.assertEqual(e.node_ids, (1,2,3,4))
+        self.assertFalse(hasattr(e, '__dict__'))
+        self.assertRaises(FrozenInstanceError, setattr, e, 'type', EEtypes.C3D10)
+
+    def test_init_wrong_node_number(self):
+        with self.assertRaisesRegex(ValueError, 'type C3D4 must have 4 node ids, got 3'):
+            Element(1, EEtypes.C3D4, (1,2,3))
+
+    def test_init_negative_id(self):
+        self.assertRaises(ValueError, Element, -1, EEtypes.C3D4, (1,2,3,4))
+
+    def test_get_dim(self):
+        self.assertEqual(Element(1, EEtypes.MASS, (1,)).get_dim(), 0)
+        self.assertEqual(Element(1, EEtypes.GAPUNI, (1,2)).get_dim(), 1)
+        self.assertEqual(Element(1, EEtypes.C3D8I, tuple(range(1, 9))).get_dim(), 3)
+
+    def test_corner_nodes(self):
+        e = Element(1, EEtypes.C3D10, tuple(range(1, 11)))
+        self.assertEqual(e.corner_node_count, 4)
+        self.assertEqual(e.get_corner_node_count(), 4)
+        self.assertEqual(e.get_corner_node_ids(), (1,2,3,4))
+
+        e = Element(1, EEtypes.SPRING2, (1,2))
+        self.assertEqual(e.get_corner_node_ids(), (1,2))
+
+    def test_get_faces_tet(self):
+        e = Element(1, EEtypes.C3D10, tuple(range(11, 21)))
+        faces = e.get_faces()
+        self.assertEqual(faces, ((11,12,13), (11,14,12), (12,14,13), (13,14,11)))
+
+    def test_get_faces_wedge(self):
+        # faces with 3 and 4 nodes
+        e = Element(1, EEtypes.C3D6, (11,12,13,14,15,16))
+        faces = e.get_faces()
+        self.assertEqual(faces, ((11,12,13), (14,15,16), (11,12,15,14), 
+                                 (12,13,16,15), (13,11,14,16)))
+
+    def test_get_faces_hex(self):
+        e = Element(1, EEtypes.C3D20R, tuple(range(1, 21)))
+        faces = e.get_faces()
+        self.assertEqual(len(faces), 6)
+        self.assertEqual(faces[1], (5,8,7,6))
+        self.assertIsInstance(faces[1][0], int)
+
+    def test_get_faces_cached(self):
+        e = Element(1, EEtypes.C3D4, (1,2,3,4))
+        self.assertIs(e.get_faces(), e.get_faces())
+        self.assertEqual(tuple(e.iter_faces()), e.get_faces())
+        # cache is not part of the comparison
+        self.assertEqual(e, Element(1, EEtypes.C3D4, (1,2,3,4)))
+
+    def test_get_faces_array(self):
+        e = Element(7, EEtypes.C3D6, (11,12,13,14,15,16))
+        faces = e.get_faces_array()
+        self.assertEqual(faces['number'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(faces['element_id'].tolist(), [7] * 5)
+        self.assertEqual(faces['node_ids'][0].tolist(), [11, 12, 13, -1])
+        self.assertEqual(faces['node_ids'][2].tolist(), [11, 12, 15, 14])
+
+        self.assertEqual(len(Element(1, EEtypes.SPRING2, (1,2)).get_faces_array()), 0)
+
+    def test_build_face_connectivity(self):
+        elems = [Element(1, EEtypes.C3D15, tuple(range(1, 16))), 
+                 Element(2, EEtypes.C3D15, tuple(range(21, 36)))]
+        conn = np.array([e.node_ids for e in elems], dtype=np.int32)
+        face_nids, numbers, elem_inds = build_face_connectivity(conn, EEtypes.C3D15)
+        self.assertEqual(face_nids.shape, (10, 4))
+        self.assertEqual(numbers.tolist(), [1,2,3,4,5] * 2)
+        self.assertEqual(elem_inds.tolist(), [0] * 5 + [1] * 5)
+        expected = np.concatenate([e.get_faces_array()['node_ids'] for e in elems])
+        self.assertEqual(face_nids.tolist(), expected.tolist())
+
+        face_nids, numbers, elem_inds = build_face_connectivity(np.array([[1, 2]]), EEtypes.SPRING2)
+        self.assertEqual((face_nids.shape, len(numbers), len(elem_inds)), ((0, 4), 0, 0))
+
+    def test_get_faces_no_faces(self):
+        e = Element(1, EEtypes.SPRING2, (1,2))
+        self.assertEqual(e.get_faces(), ())
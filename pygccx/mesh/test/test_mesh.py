@@ -17,9 +17,13 @@ along with pygccx.
 If not, see <http://www.gnu.org/licenses/>.
 '''
 
+import io
 import unittest
+import numpy as np
 from dataclasses import dataclass
-from pygccx.mesh import Mesh
+from pygccx.mesh import Mesh, Element
+from pygccx.mesh.mesh import _write_as_chunks
+from pygccx.mesh.surface import NodeSurface, get_element_faces_in_node_set
 from pygccx.enums import ESetTypes, EEtypes, ESurfTypes
 
 @dataclass()
@@ -29,6 +33,12 @@ class SetMock():
     dim:int
     ids:set[int]
 
+@dataclass()
+class ElementMock():
+    id:int
+    type:EEtypes
+    node_ids:tuple[int, ...]
+
 class TestMesh(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -67,6 +77,16 @@ class TestMesh(unittest.TestCase):
     def test_add_node_coords_not_len_3(self):
         self.assertRaises(ValueError, self.mesh.add_node, [1,2])
 
+    def test_add_node_coords_types(self):
+        coords = (1., 2., 3.)
+        id = self.mesh.add_node(coords)
+        self.assertIs(self.mesh.nodes[id], coords)
+        id = self.mesh.add_node(np.array([1, 2, 3]))
+        self.assertEqual(self.mesh.nodes[id], (1., 2., 3.))
+        self.assertIs(type(self.mesh.nodes[id][0]), float)
+        id = self.mesh.add_node((1, 2., 3.))
+        self.assertIs(type(self.mesh.nodes[id][0]), float)
+
     def test_add_node_coords_not_numeric(self):
         self.assertRaises(ValueError, self.mesh.add_node, [1,'a'])
 
@@ -108,6 +128,45 @@ class TestMesh(unittest.TestCase):
         s = SetMock('S1', ESetTypes.NODE, 2, set())
         self.assertRaises(ValueError, self.mesh.add_element, EEtypes.C3D4, (1,2,3,4), el_set=s)
 
+    def test_add_nodes(self):
+        self.mesh.add_node([0,0,0], id=3)
+        n1 = self.mesh.add_set('N1', ESetTypes.NODE, [])
+        ids = self.mesh.add_nodes(np.array([[1,0,0],[1,1,0]]), node_set=n1)
+        np.testing.assert_array_equal(ids, [4,5])
+        self.assertEqual(self.mesh.nodes[5], (1.,1.,0.))
+        self.assertIsInstance(self.mesh.nodes[5][0], float)
+        self.assertEqual(n1.ids, {4,5})
+        # with ids
+        ids = self.mesh.add_nodes([[0,1,0],[0,0,1]], ids=[10, 3])
+        np.testing.assert_array_equal(ids, [10,3])
+        self.assertEqual(self.mesh.nodes[3], (0.,0.,1.))
+        self.assertEqual(self.mesh.get_next_node_id(), 11)
+
+    def test_add_nodes_errors(self):
+        self.assertRaises(ValueError, self.mesh.add_nodes, [[0,0],[1,0]])
+        self.assertRaises(ValueError, self.mesh.add_nodes, [[0,0,'a']])
+        self.assertRaises(ValueError, self.mesh.add_nodes, [[0,0,0]], ids=[1,2])
+        self.assertRaises(ValueError, self.mesh.add_nodes, [[0,0,0]], ids=[0])
+        s = SetMock('E1', ESetTypes.ELEMENT, 0, set())
+        self.assertRaises(ValueError, self.mesh.add_nodes, [[0,0,0]], node_set=s)
+        self.assertEqual(self.mesh.nodes, {})
+
+    def test_add_elements(self):
+        e1 = self.mesh.add_set('E1', ESetTypes.ELEMENT, [])
+        ids = self.mesh.add_elements(EEtypes.SPRING2, [[1,2],[2,3]], el_set=e1)
+        np.testing.assert_array_equal(ids, [1,2])
+        self.assertEqual(self.mesh.elements[2].type, EEtypes.SPRING2)
+        self.assertEqual(self.mesh.elements[2].node_ids, (2,3))
+        self.assertEqual(e1.ids, {1,2})
+        ids = self.mesh.add_elements(EEtypes.MASS, np.array([[4]]), ids=[7])
+        self.assertEqual(self.mesh.elements[7].node_ids, (4,))
+        self.assertEqual(self.mesh.get_next_element_id(), 8)
+
+        self.assertRaises(ValueError, self.mesh.add_elements, EEtypes.SPRING2, [[1,2,3]])
+        self.assertRaises(ValueError, self.mesh.add_elements, EEtypes.SPRING2, [[1,2]], ids=[-1])
+        s = SetMock('N1', ESetTypes.NODE, 0, set())
+        self.assertRaises(ValueError, self.mesh.add_elements, EEtypes.SPRING2, [[1,2]], el_set=s)
+
     def test_get_nodes_by_ids(self):
         # make some nodes
         self.mesh.add_node([0,0,0])
@@ -126,6 +185,24 @@ class TestMesh(unittest.TestCase):
 
         self.assertRaises(KeyError, self.mesh.get_nodes_by_ids, 5)
 
+    def test_get_node_arrays(self):
+        self._make_4_nodes()
+        ids, coords = self.mesh.get_node_arrays()
+        self.assertEqual(ids.dtype, np.int32)
+        self.assertEqual(coords.dtype, np.float64)
+        np.testing.assert_array_equal(ids, [1,2,3,4])
+        np.testing.assert_array_equal(coords, [[0,0,0],[1,0,0],[1,1,0],[0,1,0]])
+
+        ids, coords = self.mesh.get_node_arrays(3, 1)
+        np.testing.assert_array_equal(ids, [3,1])
+        np.testing.assert_array_equal(coords, [[1,1,0],[0,0,0]])
+
+        self.assertRaises(KeyError, self.mesh.get_node_arrays, 5)
+
+        ids, coords = Mesh({}, {}, [], []).get_node_arrays()
+        self.assertEqual(ids.shape, (0,))
+        self.assertEqual(coords.shape, (0, 3))
+
     def test_get_elements_by_ids(self):
 
         # make some elements (nodes dont need to exist for making an lement)
@@ -161,6 +238,93 @@ class TestMesh(unittest.TestCase):
         els = self.mesh.get_elements_by_type(EEtypes.GAPUNI)
         self.assertEqual(len(els), 2)
 
+    def test_get_elements_by_type_after_changes(self):
+        self.mesh.add_element(EEtypes.SPRING2, (1,2))
+        self.mesh.add_element(EEtypes.SPRING2, (2,3))
+        self.mesh.add_elements(EEtypes.GAPUNI, [[3,4],[4,1]])
+        self.assertEqual(self.mesh.get_element_types(), (EEtypes.SPRING2, EEtypes.GAPUNI))
+        # replace an element by one of another type
+        self.mesh.add_element(EEtypes.MASS, (1,), id=1)
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRING2)], [2])
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.MASS)], [1])
+        self.mesh.add_elements(EEtypes.SPRING2, [[1,2],[1,2]], ids=[3,4])
+        self.assertEqual(self.mesh.get_element_types(), (EEtypes.MASS, EEtypes.SPRING2))
+        # change type
+        self.mesh.change_element_type(EEtypes.SPRINGA, 2, 3)
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRINGA)], [2, 3])
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRING2)], [4])
+        # elements added directly to the dict
+        self.mesh.elements[10] = Element(10, EEtypes.GAPUNI, (1,2))
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.GAPUNI)], [10])
+        # element replaced directly in the dict by one of another type
+        self.mesh.elements[1] = Element(1, EEtypes.SPRING2, (1,2))
+        self.assertEqual(self.mesh.get_elements_by_type(EEtypes.MASS), ())
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRING2)], [1, 4])
+        self.assertNotIn(EEtypes.MASS, self.mesh.get_element_types())
+        ids, conn = self.mesh.get_connectivity(EEtypes.SPRING2)
+        self.assertEqual(ids.tolist(), [1, 4])
+        self.assertEqual(conn.tolist(), [[1, 2], [1, 2]])
+        # element deleted and added again, order follows the dict
+        self.mesh.elements[1] = self.mesh.elements.pop(1)
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRING2)], [4, 1])
+        del self.mesh.elements[4]
+        self.assertEqual([e.id for e in self.mesh.get_elements_by_type(EEtypes.SPRING2)], [1])
+        # returned elements are the ones in the dict
+        e = self.mesh.get_elements_by_type(EEtypes.GAPUNI)[0]
+        self.assertIs(e, self.mesh.elements[10])
+
+    def test_get_connectivity(self):
+
+        self.mesh.add_element(EEtypes.SPRING2, (1,2))
+        self.mesh.add_element(EEtypes.GAPUNI, (3,4), id=5)
+        self.mesh.add_element(EEtypes.GAPUNI, (4,1), id=7)
+
+        ids, conn = self.mesh.get_connectivity(EEtypes.GAPUNI)
+        self.assertEqual(ids.tolist(), [5, 7])
+        self.assertEqual(conn.tolist(), [[3, 4], [4, 1]])
+        self.assertEqual(conn.dtype, np.int32)
+        self.assertTrue(conn.flags.c_contiguous)
+
+        ids, conn = self.mesh.get_connectivity(EEtypes.C3D10)
+        self.assertEqual(ids.shape, (0,))
+        self.assertEqual(conn.shape, (0, 10))
+
+        # element with a wrong number of node ids for its type
+        self.mesh.elements[9] = ElementMock(9, EEtypes.GAPUNI, (1,2,3))
+        self.assertRaises(ValueError, self.mesh.get_connectivity, EEtypes.GAPUNI)
+
+    def test_get_element_faces(self):
+
+        self.mesh.add_element(EEtypes.C3D6, (1,2,3,4,5,6))
+        self.mesh.add_element(EEtypes.C3D6, (11,12,13,14,15,16))
+        self.mesh.add_element(EEtypes.SPRING2, (1,2))
+
+        ids, faces = self.mesh.get_element_faces(EEtypes.C3D6)
+        self.assertEqual(ids.tolist(), [1, 2])
+        self.assertEqual(len(faces), 5)
+        for i, e in enumerate(self.mesh.get_elements_by_type(EEtypes.C3D6)):
+            self.assertEqual(tuple(tuple(f[i].tolist()) for f in faces), e.get_faces())
+
+        ids, faces = self.mesh.get_element_faces(EEtypes.SPRING2)
+        self.assertEqual(ids.tolist(), [3])
+        self.assertEqual(faces, ())
+
+    def test_get_face_records(self):
+
+        self.assertEqual(len(self.mesh.get_face_records()), 0)
+
+        self.mesh.add_element(EEtypes.C3D6, (1,2,3,4,5,6))
+        self.mesh.add_element(EEtypes.C3D4, (11,12,13,14))
+        self.mesh.add_element(EEtypes.C3D6, (21,22,23,24,25,26))
+        self.mesh.add_element(EEtypes.SPRING2, (1,2))
+
+        records = self.mesh.get_face_records()
+        self.assertEqual(len(records), 5 + 4 + 5)
+        order = np.lexsort((records['number'], records['element_id']))
+        expected = np.concatenate([self.mesh.elements[i].get_faces_array() for i in (1, 2, 3)])
+        for name in ('number', 'element_id', 'node_ids'):
+            self.assertEqual(records[order][name].tolist(), expected[name].tolist())
+
     def test_get_set_by_name_and_type(self):
 
         self.mesh.add_set('N1', ESetTypes.NODE, [1,2,3,4])
@@ -178,6 +342,65 @@ class TestMesh(unittest.TestCase):
 
         self.assertRaises(ValueError, self.mesh.get_set_by_name_and_type, 'Foo', ESetTypes.NODE)
 
+    def test_get_set_by_name_after_direct_append(self):
+        # sets appended directly to the lists must be found as well
+        self.mesh.add_set('N1', ESetTypes.NODE, [1,2])
+        n2 = SetMock('N2', ESetTypes.NODE, 0, {3})
+        self.mesh.node_sets.append(n2)
+        self.assertIs(self.mesh.get_node_set_by_name('n2'), n2)
+
+        mesh = Mesh({}, {}, [SetMock('N1', ESetTypes.NODE, 0, {1}), 
+                             SetMock('N1', ESetTypes.NODE, 0, {2})], [])
+        self.assertEqual(mesh.get_node_set_by_name('N1').ids, {1})
+
+    def test_get_set_and_surface_by_name_after_direct_replacement(self):
+        # sets and surfaces replaced directly in the lists must be found,
+        # the replaced ones must not be found anymore
+        self.mesh.add_set('A', ESetTypes.NODE, [1])
+        self.mesh.add_set('C', ESetTypes.ELEMENT, [1])
+        self.mesh.add_node_surface('S1', [1])
+        b = SetMock('B', ESetTypes.NODE, 0, {2})
+        d = SetMock('D', ESetTypes.ELEMENT, 0, {2})
+        s2 = NodeSurface('S2', {2}, set())
+        self.mesh.node_sets[0] = b
+        self.mesh.element_sets[0] = d
+        self.mesh.surfaces[0] = s2
+        self.assertIs(self.mesh.get_node_set_by_name('B'), b)
+        self.assertIs(self.mesh.get_el_set_by_name('D'), d)
+        self.assertIs(self.mesh.get_surface_by_name('S2'), s2)
+        self.assertRaises(ValueError, self.mesh.get_node_set_by_name, 'A')
+        self.assertRaises(ValueError, self.mesh.get_el_set_by_name, 'C')
+        self.assertRaises(ValueError, self.mesh.get_surface_by_name, 'S1')
+
+    def test_get_set_by_name_after_direct_insert_and_delete(self):
+        a = self.mesh.add_set('A', ESetTypes.NODE, [1])
+        self.mesh.add_set('B', ESetTypes.NODE, [2])
+        b = SetMock('B', ESetTypes.NODE, 0, {3})
+        self.mesh.node_sets.insert(0, b)
+        # the first set with a name wins
+        self.assertIs(self.mesh.get_node_set_by_name('b'), b)
+        self.assertIs(self.mesh.get_node_set_by_name('A'), a)
+        del self.mesh.node_sets[1]
+        self.assertRaises(ValueError, self.mesh.get_node_set_by_name, 'A')
+        self.mesh.node_sets.clear()
+        self.assertRaises(ValueError, self.mesh.get_node_set_by_name, 'B')
+        c = self.mesh.add_set('A', ESetTypes.NODE, [4])
+        self.assertIs(self.mesh.get_node_set_by_name('A'), c)
+        self.assertEqual(self.mesh.node_sets, [c])
+
+    def test_get_surface_by_name_after_direct_insert_and_delete(self):
+        s1 = self.mesh.add_node_surface('S1', [1])
+        s2 = self.mesh.add_el_face_surface('s2', [(1, 2)])
+        s3 = NodeSurface('S2', {3}, set())
+        self.mesh.surfaces.insert(0, s3)
+        self.assertIs(self.mesh.get_surface_by_name('s2'), s3)
+        self.assertIs(self.mesh.get_surface_by_name('S1'), s1)
+        self.mesh.surfaces.remove(s3)
+        self.assertIs(self.mesh.get_surface_by_name('S2'), s2)
+        self.mesh.surfaces.remove(s1)
+        self.assertRaises(ValueError, self.mesh.get_surface_by_name, 'S1')
+        self.assertIs(self.mesh.add_node_surface('s1', [2]), self.mesh.surfaces[-1])
+
     def test_get_max_node_id_and_get_next_node_id(self):
 
         self.assertEqual(self.mesh.get_max_node_id(), 0)
@@ -191,6 +414,21 @@ class TestMesh(unittest.TestCase):
         self.assertEqual(self.mesh.get_max_node_id(), 4)
         self.assertEqual(self.mesh.get_next_node_id(), 5)
 
+        # nodes added directly to the dict
+        self.mesh.nodes[10] = (0.,0.,0.)
+        self.assertEqual(self.mesh.get_max_node_id(), 10)
+        self.assertEqual(self.mesh.add_node([0,0,1]), 11)
+
+        # node deleted and another one added directly, number of nodes unchanged
+        del self.mesh.nodes[1]
+        self.mesh.nodes[101] = (0.,0.,2.)
+        self.assertEqual(self.mesh.get_max_node_id(), 101)
+        self.assertEqual(self.mesh.add_node([0,0,3]), 102)
+        self.assertEqual(self.mesh.nodes[101], (0.,0.,2.))
+
+        mesh = Mesh({3:(0.,0.,0.), 7:(1.,0.,0.)}, {}, [], [])
+        self.assertEqual(mesh.get_next_node_id(), 8)
+
     def test_get_max_element_id_and_get_next_element_id(self):
 
         self.assertEqual(self.mesh.get_max_element_id(), 0)
@@ -204,6 +442,18 @@ class TestMesh(unittest.TestCase):
         self.assertEqual(self.mesh.get_max_element_id(), 4)
         self.assertEqual(self.mesh.get_next_element_id(), 5)
 
+        self.mesh.add_element(EEtypes.GAPUNI, (4,1), id=2)
+        self.assertEqual(self.mesh.get_max_element_id(), 4)
+        self.mesh.add_element(EEtypes.GAPUNI, (4,1), id=9)
+        self.assertEqual(self.mesh.get_next_element_id(), 10)
+
+        # element deleted and another one added directly, number of elements unchanged
+        del self.mesh.elements[1]
+        self.mesh.elements[101] = Element(101, EEtypes.GAPUNI, (1,2))
+        self.assertEqual(self.mesh.get_max_element_id(), 101)
+        self.assertEqual(self.mesh.add_element(EEtypes.GAPUNI, (2,3)), 102)
+        self.assertEqual(self.mesh.elements[101].node_ids, (1,2))
+
     def test_add_set(self):
         # Tests also add_sets()
         # happy case, add node set
@@ -222,6 +472,14 @@ class TestMesh(unittest.TestCase):
         e1 = self.mesh.add_set("E1", ESetTypes.ELEMENT, ids=[3,4,5,6,7,8])
         self.assertEqual(len(self.mesh.element_sets), 1)
         self.assertEqual(len(e1.ids), 8)
+        # ids from a generator are added to an existing set
+        self.assertIs(self.mesh.add_set("e1", ESetTypes.ELEMENT, (i for i in [9])), e1)
+        self.assertEqual(len(e1.ids), 9)
+        # a new set doesn't share the given set
+        ids = {1, 2}
+        n2 = self.mesh.add_set("N2", ESetTypes.NODE, ids)
+        self.assertIsNot(n2.ids, ids)
+        self.assertEqual(n2.ids, ids)
 
     def test_add_surface(self):
         # Tests also add_surfaces()
@@ -253,6 +511,112 @@ class TestMesh(unittest.TestCase):
                           "S2", nids=[3,4,5,6,7,8])
 
 
+    def test_get_surface_by_name(self):
+        s1 = self.mesh.add_node_surface("S1", nids=[1])
+        s2 = self.mesh.add_el_face_surface("s2", faces=[(1, 1)])
+        self.assertIs(self.mesh.get_surface_by_name('s1'), s1)
+        self.assertIs(self.mesh.get_surface_by_name('S2'), s2)
+        self.assertRaises(ValueError, self.mesh.get_surface_by_name, 'S3')
+        # surfaces appended directly with a lower case name
+        s3 = NodeSurface('s3', {2}, set())
+        self.mesh.surfaces.append(s3)
+        self.assertIs(self.mesh.get_surface_by_name('S3'), s3)
+        self.mesh.add_node_surface("S3", nids=[3])
+        self.assertEqual(len(self.mesh.surfaces), 3)
+        self.assertEqual(s3.node_ids, {2, 3})
+
+    def test_get_element_faces_in_node_set(self):
+        # two hex elements on top of each other
+        self.mesh.add_elements(EEtypes.C3D8I, [[1,2,3,4,5,6,7,8], [5,6,7,8,9,10,11,12]], ids=[3,7])
+        self.mesh.add_element(EEtypes.SPRING2, (1,12))
+        top = self.mesh.add_set('TOP', ESetTypes.NODE, [9,10,11,12])
+        mid = self.mesh.add_set('MID', ESetTypes.NODE, [5,6,7,8])
+        for node_set in (top, mid):
+            expected = self.mesh.get_surface_from_node_set('S', node_set, ESurfTypes.EL_FACE).element_faces
+            ids, conn = self.mesh.get_connectivity(EEtypes.C3D8I)
+            eids, numbers = get_element_faces_in_node_set(ids, conn, EEtypes.C3D8I, node_set.ids)
+            self.assertEqual(set(zip(eids.tolist(), numbers.tolist())), expected)
+        # mid: top face of lower element and bottom face of upper element
+        self.assertEqual(set(zip(eids.tolist(), numbers.tolist())), {(3, 2), (7, 1)})
+
+        ids, conn = self.mesh.get_connectivity(EEtypes.SPRING2)
+        eids, numbers = get_element_faces_in_node_set(ids, conn, EEtypes.SPRING2, [1, 12])
+        self.assertEqual(len(eids), 0)
+        eids, numbers = get_element_faces_in_node_set(ids, conn, EEtypes.SPRING2, [])
+        self.assertEqual(len(eids), 0)
+
+    def test_write_el_face_surface(self):
+        s = self.mesh.add_el_face_surface("S2", faces=[(1, 1),(12, 6)])
+        buffer = []
+        s.write_ccx(buffer)
+        self.assertEqual(buffer[0], '*SURFACE,NAME=S2,TYPE=ELEMENT')
+        self.assertEqual(sorted(buffer[1:]), ['1,S1', '12,S6'])
+
+    def test_write_nodes_ccx(self):
+        self.mesh.add_node([0,1.5,-2e-8])
+        self.mesh.add_node([1,0,1e5], id=7)
+        buffer = []
+        self.mesh._write_nodes_ccx(buffer)
+        self.assertEqual(buffer, ['*NODE', 
+                                  '1,0.0000000e+00,1.5000000e+00,-2.0000000e-08',
+                                  '7,1.0000000e+00,0.0000000e+00,1.0000000e+05'])
+
+    def test_write_node_surface(self):
+        s = self.mesh.add_node_surface("S1", nids=[3])
+        buffer = []
+        s.write_ccx(buffer)
+        self.assertEqual(buffer, ['*SURFACE,NAME=S1,TYPE=NODE', '3'])
+        buffer = []
+        self.mesh.add_node_surface("S2", nids=[]).write_ccx(buffer)
+        self.assertEqual(buffer, ['*SURFACE,NAME=S2,TYPE=NODE'])
+
+    def test_write_elements_ccx(self):
+        self.mesh.add_element(EEtypes.SPRING2, (1,2))
+        self.mesh.add_element(EEtypes.MASS, (3,))
+        self.mesh.add_element(EEtypes.SPRING2, (2,3))
+        buffer = []
+        self.mesh._write_elements_ccx(buffer)
+        self.assertEqual(buffer, ['*ELEMENT,TYPE=SPRING2', '1,1,2', '3,2,3',
+                                  '*ELEMENT,TYPE=MASS', '2,3'])
+
+    def test_write_ccx_file(self):
+        self._make_4_nodes()
+        self.mesh.add_element(EEtypes.C3D4, (1,2,3,4))
+        self.mesh.add_set('N1', ESetTypes.NODE, [1,2])
+        self.mesh.add_node_surface('S1', [3])
+        buffer = []
+        self.mesh.write_ccx(buffer)
+        f = io.StringIO()
+        self.mesh.write_ccx_file(f)
+        self.assertEqual(f.getvalue(), '\n'.join(buffer) + '\n')
+
+        f = io.StringIO()
+        Mesh({}, {}, [], []).write_ccx_file(f)
+        self.assertEqual(f.getvalue(), '')
+
+    def test_write_multi_line_elements_ccx(self):
+        self.mesh.add_element(EEtypes.C3D20R, tuple(range(1, 21)), id=5)
+        self.mesh.add_element(EEtypes.C3D15, tuple(range(1, 16)), id=6)
+        buffer = []
+        self.mesh._write_elements_ccx(buffer)
+        expected = ['*ELEMENT,TYPE=C3D20R']
+        _write_as_chunks(expected, (5, *range(1, 21)), 16)
+        expected.append('*ELEMENT,TYPE=C3D15')
+        _write_as_chunks(expected, (6, *range(1, 16)), 16)
+        self.assertEqual(buffer, expected)
+        self.assertEqual(buffer[1:3], ['5,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,', '16,17,18,19,20'])
+
+    def test_write_as_chunks(self):
+        buffer = []
+        _write_as_chunks(buffer, tuple(range(1, 6)), 2)
+        self.assertEqual(buffer, ['1,2,', '3,4,', '5'])
+        buffer = []
+        _write_as_chunks(buffer, tuple(range(1, 5)), 2)
+        self.assertEqual(buffer, ['1,2,', '3,4'])
+        buffer = []
+        _write_as_chunks(buffer, (), 16)
+        self.assertEqual(buffer, [])
+
     def test_change_element_type(self):
 
         self.mesh.add_element(EEtypes.SPRING2, (1,2))
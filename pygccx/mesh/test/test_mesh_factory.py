@@ -20,7 +20,10 @@ If not, see <http://www.gnu.org/licenses/>.
 import os
 import unittest
 from dataclasses import dataclass
-from pygccx.mesh.mesh_factory import mesh_from_inp, mesh_from_frd
+from types import SimpleNamespace
+import numpy as np
+from pygccx.mesh.mesh_factory import mesh_from_inp, mesh_from_frd, mesh_from_gmsh
+from pygccx.mesh.mesh_factory.inp_factory import nsets_from_inp, elsets_from_inp
 from pygccx.enums import ESetTypes, EEtypes, ESurfTypes
 from pygccx.exceptions import ElementTypeNotSupportedError
 
@@ -148,6 +151,22 @@ class TestInpFactory(unittest.TestCase):
         self.assertEqual(len(mesh.element_sets), 1) # only the tet set
         self.assertEqual(len(mesh.surfaces), 2) # but with removed entities
 
+    def test_sets(self):
+        # sets.inp
+        # file contains *NSET and *ELSET, each with and without GENERATE
+        # ids of the sets without GENERATE span several lines with trailing commas
+        filename = os.path.join(self.data_path, 'sets.inp')
+
+        nsets = {s.name: s for s in nsets_from_inp(filename)}
+        self.assertEqual(nsets['GEN_NODES'].type, ESetTypes.NODE)
+        self.assertEqual(nsets['GEN_NODES'].ids, {1, 3, 5, 7, 9})
+        self.assertEqual(nsets['NODES'].ids, {1, 2, 3, 4, 5})
+
+        elsets = {s.name: s for s in elsets_from_inp(filename)}
+        self.assertEqual(elsets['GEN_ELEMS'].type, ESetTypes.ELEMENT)
+        self.assertEqual(elsets['GEN_ELEMS'].ids, {10, 11, 12})
+        self.assertEqual(elsets['ELEMS'].ids, {7, 8, 9})
+
 class TestFrdFactory(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -191,4 +210,132 @@ class TestFrdFactory(unittest.TestCase):
         # The unsupported GAP-element raises an exception
 
         path = os.path.join(self.data_path, 'beam_and_gap.frd')
-        self.assertRaises(ElementTypeNotSupportedError, mesh_from_frd, path, ignore_unsup_elems=False)
\ No newline at end of file
+        self.assertRaises(ElementTypeNotSupportedError, mesh_from_frd, path, ignore_unsup_elems=False)
+
+    def test_multi_line_elements(self):
+        # reads multi_line_elements.frd
+        # in file:
+        #   no nodes: 20
+        #   no elems: 2, node ids spread over two -2 lines
+        #       1: C3D20R, 10 + 10 node ids
+        #       2: C3D15, 10 + 5 node ids
+
+        mesh = mesh_from_frd(os.path.join(self.data_path, 'multi_line_elements.frd'))
+
+        self.assertEqual(len(mesh.nodes), 20)
+        self.assertEqual(len(mesh.elements), 2)
+        self.assertEqual(mesh.elements[1].type, EEtypes.C3D20R)
+        self.assertEqual(mesh.elements[1].node_ids, tuple(range(1, 21)))
+        self.assertEqual(mesh.elements[2].type, EEtypes.C3D15)
+        self.assertEqual(mesh.elements[2].node_ids, tuple(range(1, 16)))
+
+    def test_incomplete_element(self):
+        # reads incomplete_element.frd
+        # the C3D20R element in file has only one -2 line with 10 node ids
+        path = os.path.join(self.data_path, 'incomplete_element.frd')
+        self.assertRaises(ValueError, mesh_from_frd, path)
+
+def _gmsh_stub(entity_elems:dict, physical_groups:dict):
+    # Object with the parts of the gmsh api used by mesh_from_gmsh.
+    # entity_elems: {volume tag: [(gmsh type, element ids, node ids per element), ...]}
+    # physical_groups: {(dim, tag): (name, node ids, entity tags)}
+    # ids are returned as numpy arrays of the same dtypes as gmsh does
+    nids = np.arange(1, 21, dtype=np.uint64)
+    coords = np.arange(60, dtype=np.float64) / 2
+
+    def get_elements(dim, tag):
+        return ([et for et, _, _ in entity_elems[tag]],
+                [np.array(eids, dtype=np.uint64) for _, eids, _ in entity_elems[tag]],
+                [np.array(enids, dtype=np.uint64).ravel() for _, _, enids in entity_elems[tag]])
+
+    mesh = SimpleNamespace(
+        get_nodes=lambda: (nids, coords, np.array([])),
+        getElements=get_elements,
+        getNodesForPhysicalGroup=lambda dim, tag: (np.array(physical_groups[dim, tag][1], dtype=np.uint64), 
+                                                    np.array([])))
+    model = SimpleNamespace(
+        mesh=mesh,
+        getEntities=lambda dim: [(dim, tag) for tag in entity_elems],
+        getPhysicalGroups=lambda: list(physical_groups),
+        getPhysicalName=lambda dim, tag: physical_groups[dim, tag][0],
+        getEntitiesForPhysicalGroup=lambda dim, tag: np.array(physical_groups[dim, tag][2], dtype=np.int32))
+    return SimpleNamespace(model=model)
+
+class TestGmshFactory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # volume 1: one Tet10 and one Hex8, volume 2: one Hex20
+        self.entity_elems = {
+            1: [(11, [1], [list(range(1, 11))]), (5, [2], [list(range(11, 19))])],
+            2: [(17, [3], [list(range(1, 21))])],
+        }
+        self.physical_groups = {
+            (3, 1): ('Vol', [1, 2, 3], [1, 2]),
+            (2, 2): ('face', [4, 5], [7]),
+            (3, 3): ('part', [6], [2]),
+        }
+
+    def test_nodes(self):
+        mesh = mesh_from_gmsh(_gmsh_stub(self.entity_elems, self.physical_groups))
+
+        self.assertEqual(len(mesh.nodes), 20)
+        self.assertEqual(mesh.nodes[1], (0., 0.5, 1.))
+        self.assertEqual(mesh.nodes[20], (28.5, 29., 29.5))
+        # native python types, no numpy scalars
+        for nid, coords in mesh.nodes.items():
+            self.assertIs(type(nid), int)
+            self.assertEqual([type(c) for c in coords], [float] * 3)
+
+    def test_elements(self):
+        mesh = mesh_from_gmsh(_gmsh_stub(self.entity_elems, self.physical_groups))
+
+        self.assertEqual(len(mesh.elements), 3)
+        self.assertEqual(mesh.elements[1].type, EEtypes.C3D10)
+        self.assertEqual(mesh.elements[1].node_ids, (1,2,3,4,5,6,7,8,10,9))
+        self.assertEqual(mesh.elements[2].type, EEtypes.C3D8I)
+        self.assertEqual(mesh.elements[2].node_ids, tuple(range(11, 19)))
+        self.assertEqual(mesh.elements[3].type, EEtypes.C3D20R)
+        self.assertEqual(mesh.elements[3].node_ids, 
+                         (1,2,3,4,5,6,7,8,9,12,14,10,17,19,20,18,11,13,15,16))
+        # native python types, no numpy scalars
+        for eid, e in mesh.elements.items():
+            self.assertIs(type(eid), int)
+            self.assertIs(type(e.id), int)
+            self.assertTrue(all(type(nid) is int for nid in e.node_ids))
+
+    def test_physical_groups(self):
+        mesh = mesh_from_gmsh(_gmsh_stub(self.entity_elems, self.physical_groups))
+
+        self.assertEqual([s.name for s in mesh.node_sets], ['VOL', 'FACE', 'PART'])
+        self.assertEqual(mesh.get_node_set_by_name('VOL').ids, {1, 2, 3})
+        self.assertEqual(mesh.get_node_set_by_name('FACE').ids, {4, 5})
+        self.assertEqual(mesh.get_node_set_by_name('PART').ids, {6})
+        self.assertTrue(all(type(i) is int for s in mesh.node_sets for i in s.ids))
+        # element sets only for volume groups
+        self.assertEqual([s.name for s in mesh.element_sets], ['VOL', 'PART'])
+        self.assertEqual(mesh.get_el_set_by_name('VOL').type, ESetTypes.ELEMENT)
+        self.assertEqual(mesh.get_el_set_by_name('VOL').ids, {1, 2, 3})
+        self.assertEqual(mesh.get_el_set_by_name('PART').ids, {3})
+        self.assertTrue(all(type(i) is int for s in mesh.element_sets for i in s.ids))
+
+    def test_type_mapping(self):
+        gmsh = _gmsh_stub(self.entity_elems, self.physical_groups)
+        mesh = mesh_from_gmsh(gmsh, type_mapping={5: EEtypes.C3D8R, 17: EEtypes.C3D20})
+
+        self.assertEqual(mesh.elements[1].type, EEtypes.C3D10)
+        self.assertEqual(mesh.elements[2].type, EEtypes.C3D8R)
+        self.assertEqual(mesh.elements[3].type, EEtypes.C3D20)
+        self.assertEqual(mesh.elements[3].node_ids, 
+                         (1,2,3,4,5,6,7,8,9,12,14,10,17,19,20,18,11,13,15,16))
+        # not allowed mappings
+        self.assertRaises(ValueError, mesh_from_gmsh, gmsh, type_mapping={5: EEtypes.C3D20})
+        self.assertRaises(ValueError, mesh_from_gmsh, gmsh, type_mapping={3: EEtypes.C3D8})
+
+    def test_unsupported_elements(self):
+        # Pyramid5 (gmsh type 7) is not supported
+        self.entity_elems[2].append((7, [4], [[1, 2, 3, 4, 5]]))
+        gmsh = _gmsh_stub(self.entity_elems, self.physical_groups)
+
+        self.assertRaises(ElementTypeNotSupportedError, mesh_from_gmsh, gmsh)
+        mesh = mesh_from_gmsh(gmsh, skip_unsup_elems=True)
+        self.assertEqual(sorted(mesh.elements), [1, 2, 3])
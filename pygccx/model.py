@@ -153,8 +153,6 @@ class Model:
         """Writes the ccx input file 'jobname.inp' to the working directory."""
 
         buffer = []
-        self.mesh.write_ccx(buffer)
-
         if self.model_keywords:
             buffer.append('')
             buffer.append('***************************************')
@@ -181,6 +179,7 @@ class Model:
 
         filename = os.path.join(self.working_dir,  f'{self.jobname}.inp')
         with open(filename, 'w') as f:
+            self.mesh.write_ccx_file(f)
             f.writelines(f'{s}\n' for s in buffer)
 
     def add_model_keywords(self, *model_keywords:IKeyword):
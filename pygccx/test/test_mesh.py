@@ -19,6 +19,7 @@ If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
 from pygccx.mesh.test.test_mesh import TestMesh
+from pygccx.mesh.test.test_element import TestElement
 from pygccx.mesh.test.test_mesh_factory import TestInpFactory
 from pygccx.mesh.test.test_mesh_factory import TestFrdFactory
 